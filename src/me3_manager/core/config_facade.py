@@ -708,6 +708,26 @@ class ConfigFacade:
         except Exception:
             return False
 
+    def set_mods_enabled(self, game_name, mod_paths, enabled):
+        """Set enabled status for several mods with one profile write."""
+        try:
+            success, _ = self.mod_manager.set_mods_enabled(
+                game_name, mod_paths, enabled
+            )
+            return success
+        except Exception:
+            return False
+
+    def set_natives_enabled(self, game_name, mod_paths, enabled):
+        """Set enabled status for several DLL mods with one profile write."""
+        try:
+            success, _ = self.mod_manager.set_natives_enabled(
+                game_name, mod_paths, enabled
+            )
+            return success
+        except Exception:
+            return False
+
     def enable_native_with_options(
         self, game_name: str, mod_path: str, options: dict | None = None
     ) -> bool:
@@ -729,6 +749,26 @@ class ConfigFacade:
         except Exception:
             return False
 
+    def enable_natives_with_options(
+        self, game_name: str, natives: list[tuple[str, dict | None]]
+    ) -> bool:
+        """Enable several native DLL mods with their options in one profile write.
+
+        Args:
+            game_name (str): ID of the game
+            natives (list): (DLL file path, options dict or None) pairs
+
+        Returns:
+            True on success, False on failure
+        """
+        try:
+            success, _ = self.mod_manager.enable_natives_with_options(
+                game_name, natives
+            )
+            return success
+        except Exception:
+            return False
+
     def delete_mod(self, game_name, mod_path):
         """Delete a mod (needed by UI components)."""
         # This would be handled by ModManager in full refactor
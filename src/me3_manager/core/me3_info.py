@@ -343,7 +343,7 @@ class ME3InfoManager:
 
         for config_path in paths:
             try:
-                if config_path.exists() and config_path.is_file():
+                if config_path.is_file():
                     # Try to read the file to ensure we have permission
                     try:
                         with open(config_path, "r", encoding="utf-8") as f:
@@ -3,6 +3,7 @@ Improved and robust mod management system for ME3 Manager.
 Addresses the key issues with package mod enabling and path handling consistency.
 """
 
+import os
 import shutil
 from dataclasses import dataclass
 from enum import Enum
@@ -693,40 +694,9 @@ class ImprovedModManager:
             profile_path = self.config_manager.get_profile_path(game_name)
             config_data = self.config_manager._parse_toml_config(profile_path)
 
-            if mod_path_obj.is_dir():
-                # IMPROVEMENT: If the folder is a "container" (native-only mod),
-                # toggling it should toggle its child DLLs instead of adding it to packages.
-                has_mod_content = self._analyze_folder_content(mod_path_obj)
-
-                if not has_mod_content:
-                    # Native-only mod: toggle all contained DLLs
-                    modified = False
-                    try:
-                        for dll in mod_path_obj.rglob("*.dll"):
-                            self._set_native_enabled(
-                                config_data, str(dll), enabled, game_name
-                            )
-                            modified = True
-                    except (PermissionError, OSError):
-                        pass
-
-                    if modified:
-                        success, msg = (
-                            True,
-                            f"Toggled native mods in {mod_path_obj.name}",
-                        )
-                    else:
-                        success, msg = False, "No native mods found to toggle"
-                else:
-                    # Regular package mod: add/remove from packages
-                    success, msg = self._set_package_enabled(
-                        config_data, str(mod_path_obj), enabled, game_name
-                    )
-            else:
-                # Handle DLL mod
-                success, msg = self._set_native_enabled(
-                    config_data, mod_path, enabled, game_name
-                )
+            success, msg = self._apply_mod_enabled(
+                config_data, mod_path, enabled, game_name
+            )
 
             if success:
                 self._write_improved_config(profile_path, config_data, game_name)
@@ -738,6 +708,97 @@ class ImprovedModManager:
         except Exception as e:
             return False, f"Error setting mod status: {str(e)}"
 
+    def set_mods_enabled(
+        self, game_name: str, mod_paths: list[str], enabled: bool
+    ) -> tuple[bool, str]:
+        """
+        Set enabled status for several mods (folders or DLLs) with a single
+        profile read and write.
+        Returns (success, message)
+        """
+        try:
+            profile_path = self.config_manager.get_profile_path(game_name)
+            config_data = self.config_manager._parse_toml_config(profile_path)
+
+            changed = 0
+            for mod_path in mod_paths:
+                success, _ = self._apply_mod_enabled(
+                    config_data, mod_path, enabled, game_name
+                )
+                changed += success
+
+            if not changed:
+                return False, "No mods updated"
+
+            self._write_improved_config(profile_path, config_data, game_name)
+            action = "enabled" if enabled else "disabled"
+            return True, f"Successfully {action} {changed} mods"
+
+        except Exception as e:
+            return False, f"Error setting mod status: {str(e)}"
+
+    def _apply_mod_enabled(
+        self, config_data: dict, mod_path: str, enabled: bool, game_name: str
+    ) -> tuple[bool, str]:
+        """Update config_data in memory for set_mod_enabled / set_mods_enabled."""
+        mod_path_obj = Path(mod_path)
+
+        if not mod_path_obj.is_dir():
+            # Handle DLL mod
+            return self._set_native_enabled(config_data, mod_path, enabled, game_name)
+
+        # IMPROVEMENT: If the folder is a "container" (native-only mod),
+        # toggling it should toggle its child DLLs instead of adding it to packages.
+        has_mod_content = self._analyze_folder_content(mod_path_obj)
+
+        if has_mod_content:
+            # Regular package mod: add/remove from packages
+            return self._set_package_enabled(
+                config_data, str(mod_path_obj), enabled, game_name
+            )
+
+        # Native-only mod: toggle all contained DLLs
+        modified = False
+        try:
+            for dll in mod_path_obj.rglob("*.dll"):
+                self._set_native_enabled(config_data, str(dll), enabled, game_name)
+                modified = True
+        except (PermissionError, OSError):
+            pass
+
+        if modified:
+            return True, f"Toggled native mods in {mod_path_obj.name}"
+        return False, "No native mods found to toggle"
+
+    def set_natives_enabled(
+        self, game_name: str, mod_paths: list[str], enabled: bool
+    ) -> tuple[bool, str]:
+        """
+        Set enabled status for several native (DLL) mods with a single
+        profile read and write.
+        Returns (success, message)
+        """
+        try:
+            profile_path = self.config_manager.get_profile_path(game_name)
+            config_data = self.config_manager._parse_toml_config(profile_path)
+
+            changed = 0
+            for mod_path in mod_paths:
+                success, _ = self._set_native_enabled(
+                    config_data, mod_path, enabled, game_name
+                )
+                changed += success
+
+            if not changed:
+                return False, "No native mods updated"
+
+            self._write_improved_config(profile_path, config_data, game_name)
+            action = "enabled" if enabled else "disabled"
+            return True, f"Successfully {action} {changed} native mods"
+
+        except Exception as e:
+            return False, f"Error setting native mod status: {str(e)}"
+
     def enable_native_with_options(
         self, game_name: str, mod_path: str, options: dict[str, Any] | None = None
     ) -> tuple[bool, str]:
@@ -771,6 +832,43 @@ class ImprovedModManager:
         except Exception as e:
             return False, f"Error enabling mod with options: {str(e)}"
 
+    def enable_natives_with_options(
+        self, game_name: str, natives: list[tuple[str, dict[str, Any] | None]]
+    ) -> tuple[bool, str]:
+        """
+        Enable several native (DLL) mods, each with optional profile options,
+        with a single profile read and write.
+
+        Same result as set_mod_enabled followed by enable_native_with_options
+        for every entry.
+        Returns (success, message)
+        """
+        try:
+            profile_path = self.config_manager.get_profile_path(game_name)
+            config_data = self.config_manager._parse_toml_config(profile_path)
+
+            changed = 0
+            for mod_path, options in natives:
+                success, _ = self._set_native_enabled(
+                    config_data, mod_path, True, game_name
+                )
+                # A second pass merges options into an entry that was just
+                # re-enabled, as the separate calls would have
+                if success and options:
+                    success, _ = self._set_native_enabled(
+                        config_data, mod_path, True, game_name, extra_options=options
+                    )
+                changed += success
+
+            if not changed:
+                return False, "No native mods updated"
+
+            self._write_improved_config(profile_path, config_data, game_name)
+            return True, f"Successfully enabled {changed} native mods"
+
+        except Exception as e:
+            return False, f"Error enabling native mods: {str(e)}"
+
     def _set_native_enabled(
         self,
         config_data: dict,
@@ -1069,10 +1167,10 @@ class ImprovedModManager:
         """
         if folder.name in ACCEPTABLE_FOLDERS:
             return True
-        if any(
-            sub.is_dir() and sub.name in ACCEPTABLE_FOLDERS for sub in folder.iterdir()
-        ):
-            return True
+        # Name test first so only matching entries pay for is_dir()
+        with os.scandir(folder) as it:
+            if any(e.name in ACCEPTABLE_FOLDERS and e.is_dir() for e in it):
+                return True
         if (folder / "regulation.bin").exists():
             return True
         return False
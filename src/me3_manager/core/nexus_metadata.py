@@ -387,6 +387,19 @@ class NexusMetadataManager:
 
         return self._update_tracked_mod(local_mod_path, update_cb)
 
+    def file_signature(self) -> tuple[str, int, int] | None:
+        """(path, mtime_ns, size) of the metadata file, or None if there is none.
+
+        Changes whenever the file is rewritten, so callers can tell whether
+        results derived from it are still current.
+        """
+        path = self._metadata_file()
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return str(path), st.st_mtime_ns, st.st_size
+
     def get_for_local_mod(
         self, game_domain: str, local_mod_path: str
     ) -> TrackedNexusMod | None:
@@ -395,30 +408,44 @@ class NexusMetadataManager:
 
     def find_for_local_mod(self, local_mod_path: str) -> TrackedNexusMod | None:
         """Find a tracked mod by local path within this game's metadata file."""
+        return self.find_for_local_mods([local_mod_path]).get(local_mod_path)
+
+    def find_for_local_mods(
+        self, local_mod_paths: list[str]
+    ) -> dict[str, TrackedNexusMod]:
+        """find_for_local_mod for many paths, reading the metadata file only once.
+
+        Paths without a tracked mod are left out of the result.
+        """
+        found: dict[str, TrackedNexusMod] = {}
         try:
             # We don't know the domain for sure; try loading by the current game's domain first,
             # then fall back to a best-effort load (empty domain).
             items = self.load_game("unknown")
-            if local_mod_path in items:
-                return items[local_mod_path]
-
-            # Fallback: Check if any tracked item is a child of the requested path
-            # This handles container mods where metadata is attached to a nested file
-            local_path_obj = Path(local_mod_path)
-            for key, item in items.items():
-                if key.startswith("__cache__:"):
-                    continue
-                try:
-                    # check if 'key' (the file path in metadata) is relative to 'local_mod_path' (the container)
-                    # strict=False allows matching the path itself too, but we handled exact match above
-                    Path(key).relative_to(local_path_obj)
-                    return item
-                except ValueError:
+            tracked: list[tuple[Path, TrackedNexusMod]] | None = None
+            for local_mod_path in local_mod_paths:
+                item = items.get(local_mod_path)
+                if item is not None:
+                    found[local_mod_path] = item
                     continue
 
+                # Fallback: Check if any tracked item is a child of the requested path
+                # This handles container mods where metadata is attached to a nested file
+                if tracked is None:
+                    tracked = [
+                        (Path(key), item)
+                        for key, item in items.items()
+                        if not key.startswith("__cache__:")
+                    ]
+                local_path_obj = Path(local_mod_path)
+                for key_path, item in tracked:
+                    # check if 'key' (the file path in metadata) is relative to 'local_mod_path' (the container)
+                    if key_path.is_relative_to(local_path_obj):
+                        found[local_mod_path] = item
+                        break
         except Exception:
-            return None
-        return None
+            return found
+        return found
 
     @staticmethod
     def cache_key(game_domain: str, mod_id: int) -> str:
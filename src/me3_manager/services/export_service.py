@@ -8,6 +8,7 @@ from typing import Any
 
 from me3_manager.core.profiles.profile_manager import ProfileManager
 from me3_manager.core.profiles.toml_profile_writer import TomlProfileWriter
+from me3_manager.utils.copy_utils import fast_copy
 
 
 class ExportService:
@@ -243,13 +244,14 @@ class ExportService:
 
                 # Copy packages to mods/<dest_name>
                 for src_folder, dest_name in package_sources:
-                    if src_folder.exists() and src_folder.is_dir():
+                    if src_folder.is_dir():
                         (tmp_root / "mods").mkdir(parents=True, exist_ok=True)
                         shutil.copytree(
                             src_folder,
                             tmp_root / "mods" / dest_name,
                             symlinks=False,
                             ignore_dangling_symlinks=True,
+                            copy_function=fast_copy,
                         )
 
                 # Copy native files that are not already inside a copied package
@@ -263,14 +265,14 @@ class ExportService:
                             continue
                     except Exception:
                         pass
-                    if src_file.exists() and src_file.is_file():
+                    if src_file.is_file():
                         (tmp_root / "mods").mkdir(parents=True, exist_ok=True)
                         target = tmp_root / "mods" / dest_rel
                         target.parent.mkdir(parents=True, exist_ok=True)
                         if src_file.resolve() == target.resolve():
                             # Avoid copying a file onto itself
                             continue
-                        shutil.copy2(src_file, target)
+                        fast_copy(src_file, target)
 
                         # Also include associated config folder and files next to the DLL
                         try:
@@ -286,6 +288,7 @@ class ExportService:
                                         dst_cfg_dir,
                                         symlinks=False,
                                         ignore_dangling_symlinks=True,
+                                        copy_function=fast_copy,
                                     )
                             # 2) Common config files with same stem
                             for ext in (".ini", ".cfg", ".toml", ".json"):
@@ -296,7 +299,7 @@ class ExportService:
                                         dst_cfg.exists()
                                         and dst_cfg.resolve() == src_cfg.resolve()
                                     ):
-                                        shutil.copy2(src_cfg, dst_cfg)
+                                        fast_copy(src_cfg, dst_cfg)
                         except Exception:
                             pass
 
@@ -174,7 +174,7 @@ class ConfigEditorDialog(QDialog):
 
     def load_config(self, path: Path):
         try:
-            if path.exists() and path.is_file():
+            if path.is_file():
                 with open(path, "r", encoding="utf-8") as f:
                     self.editor.setText(f.read())
                 self.current_path = path
@@ -1,4 +1,5 @@
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -135,6 +136,9 @@ class GamePage(QWidget):
     Acts as a central controller, delegating tasks to specialized handlers.
     """
 
+    # Quiet time after the last keystroke before the local mod list is filtered
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self, game_name: str, config_manager):
         super().__init__()
 
@@ -152,6 +156,7 @@ class GamePage(QWidget):
         self.filtered_mods: dict[str, Any] = {}
         self.all_mods_data: dict[str, Any] = {}
         self.mod_infos: dict[str, Any] = {}
+        self.expanded_states: dict[str, bool] = {}
         self.acceptable_folders = ACCEPTABLE_FOLDERS
         self.search_mode: str = "local"  # local | nexus
         self.selected_local_mod_path: str | None = None
@@ -160,6 +165,11 @@ class GamePage(QWidget):
         self._nexus_last_results = []
         self.setAcceptDrops(True)
 
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.apply_filters(reset_page=True))
+
         self.builder = UiBuilder(self)
         self.drag_drop_handler = DragDropHandler(self)
         self.mod_installer = ModInstaller(self)
@@ -354,9 +364,9 @@ class GamePage(QWidget):
             self._set_local_mods_visibility(True)
 
     def on_search_text_changed(self):
-        # In local mode, keep existing live filtering.
+        # In local mode, filter once typing pauses (each keystroke restarts the timer)
         if self.search_mode == "local":
-            self.apply_filters(reset_page=True)
+            self.search_timer.start()
         elif self.search_mode == "community":
             self.perform_community_search()
         else:
@@ -370,7 +380,11 @@ class GamePage(QWidget):
 
     def on_search_return_pressed(self):
         # In nexus mode, we'll use Enter to trigger an API lookup.
-        if self.search_mode == "nexus":
+        if self.search_mode == "local":
+            # Filter right away instead of waiting out the debounce
+            self.search_timer.stop()
+            self.apply_filters(reset_page=True)
+        elif self.search_mode == "nexus":
             # Implemented in later steps (nexus_search_panel)
             try:
                 self.perform_nexus_search()
@@ -1235,7 +1249,7 @@ class GamePage(QWidget):
         )
         folder_path = mods_dir / installed_name
 
-        if folder_path.exists() and folder_path.is_dir():
+        if folder_path.is_dir():
             local_path = self._determine_metadata_local_path(folder_path)
         else:
             local_path = str(folder_path.resolve())
@@ -1829,9 +1843,6 @@ class GamePage(QWidget):
     def update_filter_button_styles(self):
         self.mod_list_handler.update_filter_button_styles()
 
-    def _group_mods_for_tree_display(self, mod_items):
-        return self.mod_list_handler._group_mods_for_tree_display(mod_items)
-
     def _on_mod_expand_requested(self, mod_path: str, expanded: bool):
         self.mod_list_handler._on_mod_expand_requested(mod_path, expanded)
 
@@ -1849,6 +1860,9 @@ class GamePage(QWidget):
     def update_pagination(self):
         self.pagination_handler.update_pagination()
 
+    def update_pagination_status(self):
+        self.pagination_handler.update_status_label()
+
     # Delegated Mod Actions (Toggle, Delete, etc.)
 
     def toggle_mod(self, mod_path: str, enabled: bool):
@@ -2203,10 +2217,10 @@ class GamePage(QWidget):
             seamless_enabled = False
 
             for mod_path, info in mods_data.items():
-                if not info.get("enabled", False):
+                if not info.enabled:
                     continue
                 path_lower = str(mod_path).lower()
-                name_lower = str(info.get("name", "")).lower()
+                name_lower = info.name_lower
 
                 for dll in alt_save_dlls:
                     # 1. Check if file path ends with the dll name
@@ -2248,7 +2262,7 @@ class GamePage(QWidget):
             enabled_reg_mods_count = 0
 
             for mod_path, info in mods_data.items():
-                is_enabled = info.get("enabled", False)
+                is_enabled = info.enabled
                 if is_enabled:
                     p = Path(mod_path)
                     if p.is_dir() and (p / "regulation.bin").exists():
@@ -2278,11 +2292,10 @@ class GamePage(QWidget):
         """
         if folder.name in self.acceptable_folders:
             return True
-        if any(
-            sub.is_dir() and sub.name in self.acceptable_folders
-            for sub in folder.iterdir()
-        ):
-            return True
+        # Name test first so only matching entries pay for is_dir()
+        with os.scandir(folder) as it:
+            if any(e.name in self.acceptable_folders and e.is_dir() for e in it):
+                return True
         if (folder / "regulation.bin").exists():
             return True
         return False
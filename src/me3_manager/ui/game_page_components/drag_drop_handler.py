@@ -7,7 +7,6 @@ Simplified handler that delegates all mod installation to ModInstaller.install_m
 import logging
 import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QTimer
@@ -16,6 +15,7 @@ from PySide6.QtWidgets import QInputDialog
 
 from me3_manager.utils.archive_utils import ARCHIVE_EXTENSIONS
 from me3_manager.utils.constants import ACCEPTABLE_FOLDERS
+from me3_manager.utils.copy_utils import fast_copy
 from me3_manager.utils.nexus_filename_parser import parse_nexus_filename
 from me3_manager.utils.translator import tr
 
@@ -90,19 +90,25 @@ class DragDropHandler:
 
         mod_name = mod_name.strip()
 
-        # Create a temporary folder with the mod name and copy all assets into it
-        with TemporaryDirectory() as tmp:
-            staged_mod = Path(tmp) / mod_name
+        # Copy all assets into a folder with the mod name, staged next to the
+        # mods dir so the install can move it into place instead of copying
+        # it a second time
+        with self.game_page.mod_installer.staging_dir() as tmp:
+            staged_mod = tmp / mod_name
             staged_mod.mkdir(parents=True, exist_ok=True)
 
             for asset in asset_paths:
                 dest = staged_mod / asset.name
                 if asset.is_dir():
                     shutil.copytree(
-                        asset, dest, symlinks=False, ignore_dangling_symlinks=True
+                        asset,
+                        dest,
+                        symlinks=False,
+                        ignore_dangling_symlinks=True,
+                        copy_function=fast_copy,
                     )
                 else:
-                    shutil.copy2(asset, dest, follow_symlinks=False)
+                    fast_copy(asset, dest, follow_symlinks=False)
 
             # Install the staged mod folder
             result = self.game_page.mod_installer.install_mod(
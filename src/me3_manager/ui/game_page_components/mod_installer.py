@@ -10,18 +10,32 @@ All installations flow through a single entry point: install_mod()
 """
 
 import copy
+import importlib.util
 import logging
+import os
 import re
 import shutil
-from collections.abc import Callable
+import stat
+import tomllib
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import ModuleType
 from typing import TYPE_CHECKING, Literal
 
-import tomlkit
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import (
+    QElapsedTimer,
+    QLockFile,
+    Qt,
+    QThread,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -37,7 +51,8 @@ from me3_manager.core.config_applicator import ConfigApplicator
 from me3_manager.core.profiles.profile_manager import ProfileManager
 from me3_manager.ui.dialogs.user_prompts_dialog import UserPromptsDialog
 from me3_manager.utils.archive_utils import ARCHIVE_EXTENSIONS, extract_archive
-from me3_manager.utils.constants import ACCEPTABLE_FOLDERS
+from me3_manager.utils.constants import ACCEPTABLE_FOLDERS, JUNK_NAMES
+from me3_manager.utils.copy_utils import durable_replace, fast_copy, link_or_copy
 from me3_manager.utils.translator import tr
 
 if TYPE_CHECKING:
@@ -70,15 +85,41 @@ RESERVED_NAMES = {
     "LPT9",
 }
 
-# Regex for valid mod names
-NAME_RE = re.compile(r'^[^<>:"/\\|?*]{1,60}$')
+# Regex for valid mod names: 1-60 characters without any that are illegal on
+# Windows, not a reserved device name (with or without extension), and not
+# ending in a dot or space (which also rules out "." and "..")
+_RESERVED_ALT = "|".join(sorted(RESERVED_NAMES))
+NAME_RE = re.compile(
+    rf"(?i)(?!(?:{_RESERVED_ALT})(?:\.|$))" + r'[^<>:"/\\|?*]{1,60}(?<![. ])'
+)
+_name_fullmatch = NAME_RE.fullmatch
+
+# Nexus Mods page URL -> (game_domain, mod_id)
+_NEXUS_URL_RE = re.compile(r"(?:https?://)?(?:www\.)?nexusmods\.com/([^/]+)/mods/(\d+)")
 
-# Common junk files/folders to filter out
-_JUNK_NAMES = frozenset({"__MACOSX", ".DS_Store"})
+# Characters Windows forbids in file names, mapped to "_" for str.translate
+_FORBIDDEN_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
 
 # Files that should be overwritten (Mod binaries/core files)
 # Everything else is considered user data/config and should be preserved if it exists
-_BINARY_EXTENSIONS = {".dll", ".exe", ".bin"}
+_BINARY_EXTENSIONS = frozenset({".dll", ".exe", ".bin"})
+
+# Set form of ACCEPTABLE_FOLDERS for per-child lookups
+_ACCEPTABLE_FOLDER_SET = frozenset(ACCEPTABLE_FOLDERS)
+
+# Scratch folder (sibling of the mods dir) used for staging extracted sources
+_TEMP_DIR_NAME = ".me3_temp_extraction"
+
+# App-owned scratch folder (sibling of the mods dir) holding one folder per
+# InstallWorker run for staged copies and deferred deletes; each run folder
+# has a "<name>.lock" QLockFile next to it while its worker is alive
+_SCRATCH_DIR_NAME = ".me3_install_scratch"
+
+# File copies are I/O bound, so overlap them well past the core count
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Concurrent Nexus API lookups; kept small to stay within the API's fair use
+_NEXUS_FETCH_WORKERS = 4
 
 
 @dataclass
@@ -91,48 +132,246 @@ class InstallOptions:
     load_mods: bool = True
 
 
-def _contains_symlink(path: Path) -> bool:
-    """Check if a path or any of its contents are symlinks."""
-    if path.is_symlink():
-        return True
-    if path.is_dir():
-        for p in path.rglob("*"):
-            if p.is_symlink():
-                return True
+def _scandir_recursive(path: str | os.PathLike) -> Iterator[os.DirEntry]:
+    """Yield every entry below path, without following directory symlinks.
+
+    Unreadable or vanished directories are skipped.
+    """
+    try:
+        it = os.scandir(path)
+    except (PermissionError, FileNotFoundError):
+        return
+    with it:
+        for entry in it:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+
+
+def _walk_files(
+    root: str | os.PathLike, rel: str = ""
+) -> Iterator[tuple[os.DirEntry, str]]:
+    """Yield (entry, path relative to root) for every regular file below root.
+
+    Symlinks are skipped. The relative path is built up by string
+    concatenation while descending, so no per-file path arithmetic is needed.
+    """
+    try:
+        it = os.scandir(root)
+    except (PermissionError, FileNotFoundError):
+        return
+    with it:
+        for entry in it:
+            rel_path = rel + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, rel_path + os.sep)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry, rel_path
+
+
+def _plan_copy(path: Path) -> tuple[list[str], list[str], bool, bool]:
+    """Walk path once and list what copying it involves.
+
+    Junk names are left out (and not descended into). Symlinks are noted
+    from the cached d_type, so no extra lstat, and are left out too;
+    InstallWorker rejects items that contain any.
+
+    Returns (dirs, files, has_junk, has_symlink) with dirs and files as
+    paths relative to path, parents listed before their children.
+    """
+    dirs: list[str] = []
+    files: list[str] = []
+    has_junk = False
+    has_symlink = False
+    pending = [(os.fspath(path), "")]
+    while pending:
+        top, rel = pending.pop()
+        try:
+            it = os.scandir(top)
+        except (PermissionError, FileNotFoundError):
+            continue
+        with it:
+            for entry in it:
+                if entry.name in JUNK_NAMES:
+                    has_junk = True
+                elif entry.is_symlink():
+                    has_symlink = True
+                elif entry.is_dir():
+                    rel_path = rel + entry.name
+                    dirs.append(rel_path)
+                    pending.append((entry.path, rel_path + os.sep))
+                elif entry.is_file():
+                    files.append(rel + entry.name)
+    return dirs, files, has_junk, has_symlink
+
+
+def _count_files(path: Path) -> tuple[int, bool, bool]:
+    """Count the files below path, ignoring junk names.
+
+    Returns (file_count, has_junk, has_symlink).
+    """
+    _dirs, files, has_junk, has_symlink = _plan_copy(path)
+    return len(files), has_junk, has_symlink
+
+
+def _has_nonbinary(root: str | os.PathLike) -> bool:
+    """Return True as soon as a file that isn't a mod binary is found below root."""
+    for entry, _rel in _walk_files(root):
+        if os.path.splitext(entry.name)[1].lower() not in _BINARY_EXTENSIONS:
+            return True
     return False
 
 
+def _iter_dlls(root: str | os.PathLike) -> Iterator[str]:
+    """Yield the path of every .dll file below root."""
+    for entry in _scandir_recursive(root):
+        if entry.name.lower().endswith(".dll") and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _scan_flags(folder: Path) -> dict[str, tuple[bool, bool]]:
+    """Walk folder once and report whether it holds any .me3 and any .dll files.
+
+    Returns {path: (has_me3, has_dll)} for folder and, since the walk covers
+    them anyway, for each immediate subfolder. Stops at the first .me3 file,
+    since that alone decides the mod type; only folder itself is reported then.
+    """
+    root = os.fspath(folder)
+    flags: dict[str, tuple[bool, bool]] = {}
+    has_dll = False
+    try:
+        it = os.scandir(root)
+    except (PermissionError, FileNotFoundError):
+        return {root: (False, False)}
+    with it:
+        for top in it:
+            entries = [top]
+            if top.is_dir(follow_symlinks=False):
+                entries = _scandir_recursive(top.path)
+            sub_dll = False
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith(".me3"):
+                    if entry.is_file():
+                        return {root: (True, has_dll or sub_dll)}
+                elif not sub_dll and name.endswith(".dll") and entry.is_file():
+                    sub_dll = True
+            if top.is_dir(follow_symlinks=False):
+                flags[top.path] = (False, sub_dll)
+            has_dll = has_dll or sub_dll
+    flags[root] = (False, has_dll)
+    return flags
+
+
+@lru_cache(maxsize=4096)
 def _validate_mod_name(mod_name: str) -> bool:
     """Validate mod name against reserved names and illegal characters."""
-    if not mod_name or not NAME_RE.fullmatch(mod_name):
-        return False
-    if Path(mod_name).stem.upper() in RESERVED_NAMES:
-        return False
-    if mod_name in (".", ".."):
-        return False
-    if mod_name[-1] in {".", " "}:
-        return False
-    return True
+    return _name_fullmatch(mod_name) is not None
 
 
-def _filter_children(folder: Path) -> list[Path]:
-    """Filter out junk files/folders from a directory listing."""
+def _filter_children(folder: Path) -> list[os.DirEntry]:
+    """Filter out junk files/folders from a directory listing.
+
+    Entries are returned as is, so callers get is_dir()/is_file() from the
+    cached d_type instead of a stat per child.
+    """
     try:
-        return [p for p in folder.iterdir() if p.name not in _JUNK_NAMES]
-    except Exception:
+        with os.scandir(folder) as it:
+            return [e for e in it if e.name not in JUNK_NAMES]
+    except OSError:
         return []
 
 
-def _copy_item(src: Path, dst: Path) -> bool:
-    """Copy a file or directory to destination. Returns True on success."""
+def _discard_tree(path: Path, trash_root: Path) -> None:
+    """Remove a directory tree without waiting for the delete to finish.
+
+    The tree is first renamed into ``trash_root`` (a single metadata operation
+    when both are on the same filesystem), so ``path`` is free immediately; the
+    actual deletion then runs on the global thread pool. Falls back to a
+    blocking ``rmtree`` when the rename is not possible.
+    """
     try:
-        if src.is_dir():
-            shutil.copytree(src, dst, symlinks=False, ignore_dangling_symlinks=True)
-        else:
-            shutil.copy2(src, dst, follow_symlinks=False)
-        return True
-    except Exception:
-        return False
+        trash_root.mkdir(parents=True, exist_ok=True)
+        doomed = trash_root / f".trash-{uuid.uuid4().hex}"
+        os.replace(path, doomed)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    QThreadPool.globalInstance().start(
+        lambda: shutil.rmtree(doomed, ignore_errors=True)
+    )
+
+
+def _claim_run_dir(scratch_root: Path) -> tuple[Path, QLockFile]:
+    """Create and lock a fresh run folder below scratch_root.
+
+    The lock is taken before the folder exists, so a concurrent sweep can
+    never see the folder unowned.
+    """
+    scratch_root.mkdir(parents=True, exist_ok=True)
+    run_dir = scratch_root / uuid.uuid4().hex
+    lock = QLockFile(f"{run_dir}.lock")
+    # Installs can take longer than the default 30s; only a dead owner is stale
+    lock.setStaleLockTime(0)
+    lock.lock()
+    run_dir.mkdir()
+    return run_dir, lock
+
+
+def _release_run_dir(run_dir: Path, lock: QLockFile) -> None:
+    """Delete a run folder on the global thread pool, then drop its lock."""
+
+    def release():
+        shutil.rmtree(run_dir, ignore_errors=True)
+        lock.unlock()
+
+    QThreadPool.globalInstance().start(release)
+
+
+def _sweep_leftovers(scratch_root: Path) -> None:
+    """Delete run folders left behind by an install that was killed.
+
+    Only folders whose lock can be taken are swept, so runs of live workers,
+    in this process or another instance, are left alone. Nothing outside
+    scratch_root is touched. The deletes run on the global thread pool.
+    """
+    names = set()
+    try:
+        with os.scandir(scratch_root) as it:
+            for entry in it:
+                if entry.name.endswith(".lock"):
+                    names.add(entry.name.removesuffix(".lock"))
+                elif entry.is_dir(follow_symlinks=False):
+                    names.add(entry.name)
+    except OSError:
+        return
+    for name in names:
+        lock = QLockFile(os.path.join(scratch_root, f"{name}.lock"))
+        lock.setStaleLockTime(0)
+        if lock.tryLock(0):
+            _release_run_dir(scratch_root / name, lock)
+
+
+def _load_hook_module(
+    script_path: Path, cache: dict[tuple[str, int, int], ModuleType]
+) -> ModuleType | None:
+    """Load an install hook script, reusing the module in cache if unchanged.
+
+    cache is keyed by (path, mtime_ns, size) and owned by the caller, so
+    module state never outlives the install that loaded it.
+    """
+    st = script_path.stat()
+    key = (str(script_path), st.st_mtime_ns, st.st_size)
+    module = cache.get(key)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location("mod_hook", script_path)
+    if not spec or not spec.loader:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    cache[key] = module
+    return module
 
 
 class ActionWorker(QThread):
@@ -164,21 +403,72 @@ class InstallWorker(QThread):
     progress_update = Signal(str, int, int)  # status, current, total
     finished_signal = Signal(int, list)  # installed_count, errors
 
+    # Minimum time between progress signals so the GUI thread isn't flooded
+    PROGRESS_INTERVAL_MS = 100
+
     def __init__(
-        self, items_to_install: list[Path | tuple[Path, Path]], mods_dir: Path
+        self,
+        items_to_install: list[Path | tuple[Path, Path]],
+        mods_dir: Path,
+        *,
+        consume_sources: bool = False,
     ):
         super().__init__()
         self.items = items_to_install
         self.mods_dir = mods_dir
+        # consume_sources: sources are throwaway staging copies, so they can be
+        # moved or hard-linked into place instead of copied
+        self.consume_sources = consume_sources
+        self.copy_file = link_or_copy if consume_sources else fast_copy
+        self.scratch_root = mods_dir.parent / _SCRATCH_DIR_NAME
+        # This run's folder below scratch_root, set while run() is going
+        self.run_dir: Path | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._progress_timer = QElapsedTimer()
+
+    def _report_progress(self, name: str, current: int, total: int):
+        """Emit progress_update at most once per PROGRESS_INTERVAL_MS."""
+        timer = self._progress_timer
+        if timer.isValid() and not timer.hasExpired(self.PROGRESS_INTERVAL_MS):
+            return
+        # tr() handles translations with bad placeholders; throttling already
+        # keeps this to a few lookups per second
+        status = tr("installing_status", name=name)
+        self.progress_update.emit(status, current, total)
+        timer.start()
 
     def run(self):
         self.installed_count = 0
         self.errors = []
-        parent = self.mods_dir.resolve()
+        _sweep_leftovers(self.scratch_root)
+        try:
+            self.run_dir, lock = _claim_run_dir(self.scratch_root)
+        except OSError as e:
+            self.errors.append(
+                tr("copy_failed_msg", name=self.scratch_root.name, error=str(e))
+            )
+            self.finished_signal.emit(0, self.errors)
+            return
+        try:
+            self._install_items()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+            _release_run_dir(self.run_dir, lock)
+            self.run_dir = None
+
+        self.finished_signal.emit(self.installed_count, self.errors)
+
+    def _install_items(self):
+        """Install every item, staging copies in this run's scratch folder."""
+        # Trailing separator so "mods_other" doesn't pass as inside "mods"
+        parent_prefix = os.path.join(os.path.realpath(self.mods_dir), "")
 
         # Phase 1: Count total files for accurate progress
         total_files = 0
-        file_to_item_map = []  # List of (source, dest_rel)
+        # List of (source, dest_rel, file_count, has_junk, has_symlink, plan)
+        file_to_item_map = []
         for item_entry in self.items:
             if isinstance(item_entry, tuple):
                 source_path, dest_rel_path = item_entry
@@ -186,204 +476,279 @@ class InstallWorker(QThread):
                 source_path = item_entry
                 dest_rel_path = Path(item_entry.name)
 
-            file_to_item_map.append((source_path, dest_rel_path))
-
-            if source_path.is_file():
-                total_files += 1
+            plan = None
+            if os.path.islink(source_path):
+                item_files, has_junk, has_symlink = 1, False, True
+            elif source_path.is_file():
+                item_files, has_junk, has_symlink = 1, False, False
             else:
-                # Count files recursively, ignoring junk
-                for p in source_path.rglob("*"):
-                    if p.is_file() and p.name not in _JUNK_NAMES:
-                        total_files += 1
+                # The walk that counts files also lists them for the copy
+                dirs, files, has_junk, has_symlink = _plan_copy(source_path)
+                item_files = len(files)
+                plan = (dirs, files)
+            total_files += item_files
+            file_to_item_map.append(
+                (source_path, dest_rel_path, item_files, has_junk, has_symlink, plan)
+            )
 
         if total_files == 0:
             total_files = len(self.items) or 1
 
         current_file_index = 0
 
-        for source_path, dest_rel_path in file_to_item_map:
+        for (
+            source_path,
+            dest_rel_path,
+            item_files,
+            has_junk,
+            has_symlink,
+            plan,
+        ) in file_to_item_map:
             if self.isInterruptionRequested():
                 break
 
             try:
-                if _contains_symlink(source_path):
+                if has_symlink:
                     msg = tr("symlink_rejected_msg", name=dest_rel_path.name)
                     self.errors.append(msg)
-                    # Advance progress for failed item (rough estimate)
-                    if source_path.is_file():
-                        current_file_index += 1
-                    else:
-                        current_file_index += sum(
-                            1 for _ in source_path.rglob("*") if _.is_file()
-                        )
+                    # Advance progress for failed item
+                    current_file_index += item_files
                     continue
 
                 dest_path = self.mods_dir / dest_rel_path
-                try:
-                    dest_path.resolve().relative_to(parent)
-                except ValueError:
+                if not os.path.realpath(dest_path).startswith(parent_prefix):
                     msg = tr("invalid_destination_path_msg", name=dest_rel_path.name)
                     self.errors.append(msg)
                     continue
 
-                with TemporaryDirectory(dir=str(parent)) as tmp_root_str:
+                # Ensure parent directory exists
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Only mods with non-binary files have user settings to keep
+                keep_configs = dest_path.is_dir() and _has_nonbinary(dest_path)
+
+                # Throwaway sources can be moved into place when there is
+                # nothing to preserve (junk is only filtered by the copy)
+                if self.consume_sources and not has_junk and not keep_configs:
+                    moved = False
+                    if not dest_path.exists():
+                        try:
+                            durable_replace(source_path, dest_path)
+                            moved = True
+                        except OSError:
+                            pass
+                    elif dest_path.is_dir() and source_path.is_dir():
+                        self._merge_directories(source_path, dest_path)
+                        moved = True
+                    if moved:
+                        current_file_index += item_files
+                        self._report_progress(
+                            dest_rel_path.name, current_file_index, total_files
+                        )
+                        self.installed_count += 1
+                        continue
+
+                # Stage in this run's scratch folder, a sibling of the mods
+                # dir, so the final swap is normally a same-filesystem rename
+                with TemporaryDirectory(dir=str(self.run_dir)) as tmp_root_str:
                     tmp_root = Path(tmp_root_str)
 
                     # Prepare backup of existing config files
                     backup_dir = tmp_root / "_config_backup"
 
-                    if dest_path.exists() and dest_path.is_dir():
+                    if keep_configs:
                         self._backup_configs(dest_path, backup_dir)
 
                     tmp_dst = tmp_root / dest_rel_path.name
-
                     if source_path.is_dir():
                         # Manual copy with progress
                         self._copy_recursive_with_progress(
-                            source_path, tmp_dst, current_file_index, total_files
+                            source_path,
+                            tmp_dst,
+                            current_file_index,
+                            total_files,
+                            self.copy_file,
+                            plan,
                         )
                         # Update index after directory copy
-                        current_file_index += sum(
-                            1
-                            for p in source_path.rglob("*")
-                            if p.is_file() and p.name not in _JUNK_NAMES
-                        )
+                        current_file_index += item_files
                     else:
-                        shutil.copy2(source_path, tmp_dst, follow_symlinks=False)
+                        self.copy_file(source_path, tmp_dst, follow_symlinks=False)
                         current_file_index += 1
-                        self.progress_update.emit(
-                            tr("installing_status", name=dest_rel_path.name),
-                            current_file_index,
-                            total_files,
+                        self._report_progress(
+                            dest_rel_path.name, current_file_index, total_files
                         )
 
-                    # Ensure parent directory exists
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
                     # Atomic replace or Merge
                     try:
                         # try atomic move first (works for new folders)
-                        tmp_dst.replace(dest_path)
+                        durable_replace(tmp_dst, dest_path)
                     except OSError:
-                        if dest_path.exists() and dest_path.is_dir():
+                        if dest_path.is_dir():
                             # Destination exists and is a directory -> MERGE
                             # We move contents from tmp_dst to dest_path
                             self._merge_directories(tmp_dst, dest_path)
                             # Cleanup temp source dir
                             shutil.rmtree(tmp_dst)
                         else:
-                            # Not a directory or some other error -> Overwrite
-                            if dest_path.is_dir():
-                                shutil.rmtree(dest_path)
-                            elif dest_path.exists():
+                            # Not a directory or some other error -> Overwrite;
+                            # shutil.move also copes with the scratch folder
+                            # being on another filesystem
+                            if dest_path.exists():
                                 dest_path.unlink()
-                            tmp_dst.replace(dest_path)
+                            shutil.move(tmp_dst, dest_path)
 
                     # Restore configs if they were backed up
                     if backup_dir.exists():
                         self._restore_configs(backup_dir, dest_path)
 
                 self.installed_count += 1
+            except shutil.Error as e:
+                # Per-file failures collected during the copy
+                failures = e.args[0] if isinstance(e.args[0], list) else None
+                if failures is None:
+                    failures = [(dest_rel_path.name, "", str(e))]
+                self.errors.extend(
+                    tr("copy_failed_msg", name=os.path.basename(src), error=why)
+                    for src, _dst, why in failures
+                )
             except Exception as e:
                 self.errors.append(
                     tr("copy_failed_msg", name=dest_rel_path.name, error=str(e))
                 )
 
-        self.finished_signal.emit(self.installed_count, self.errors)
+    def _copy_pool(self) -> ThreadPoolExecutor:
+        """Thread pool shared by every item of this run, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=_COPY_WORKERS)
+        return self._pool
 
     def _merge_directories(self, src: Path, dst: Path):
-        """Recursively merge src directory into dst directory."""
-        if not dst.exists():
-            dst.mkdir(parents=True, exist_ok=True)
-
-        for item in src.iterdir():
-            dst_path = dst / item.name
-            if item.is_dir():
-                self._merge_directories(item, dst_path)
-            else:
-                # Force overwrite files
-                if dst_path.exists() or dst_path.is_symlink():
-                    try:
-                        dst_path.unlink()
-                    except IsADirectoryError:
-                        shutil.rmtree(dst_path)
-                shutil.move(str(item), str(dst_path))
+        """Recursively merge src directory into dst directory, moving files."""
+
+        def move_over(s: str, d: str):
+            # Force overwrite files; a directory in the way is replaced too
+            if os.path.isdir(d) and not os.path.islink(d):
+                _discard_tree(Path(d), self.run_dir)
+            try:
+                os.replace(s, d)
+            except OSError:
+                # e.g. staging and destination on different filesystems
+                shutil.move(s, d)
+
+        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=move_over)
 
     def _copy_recursive_with_progress(
-        self, src: Path, dst: Path, start_idx: int, total: int
+        self,
+        src: Path,
+        dst: Path,
+        start_idx: int,
+        total: int,
+        copy_file: Callable = fast_copy,
+        plan: tuple[list[str], list[str]] | None = None,
     ):
-        """Recursively copy directory and emit progress updates."""
-        if not dst.exists():
-            dst.mkdir(parents=True, exist_ok=True)
-
-        # We need a shared counter across recursive calls
-        counter = [start_idx]
+        """Recursively copy directory and emit progress updates.
 
-        def _copy_internal(s: Path, d: Path):
+        The directory tree is created up front and the files are then copied
+        on the run's shared thread pool. Keeps going past files that fail to copy and raises
+        a single shutil.Error listing all of them at the end, like
+        shutil.copytree. plan is the (dirs, files) listing from _plan_copy;
+        src is walked here only when it isn't given.
+        """
+        if plan is None:
+            dirs, files, _has_junk, _has_symlink = _plan_copy(src)
+        else:
+            dirs, files = plan
+        src_str, dst_str = os.fspath(src), os.fspath(dst)
+        os.makedirs(dst_str, exist_ok=True)
+        for rel in dirs:
+            os.makedirs(os.path.join(dst_str, rel), exist_ok=True)
+        jobs = [
+            (os.path.join(src_str, rel), os.path.join(dst_str, rel)) for rel in files
+        ]
+
+        def copy_one(s: str, d: str) -> bool:
             if self.isInterruptionRequested():
-                return
+                return False
+            copy_file(s, d, follow_symlinks=False)
+            return True
 
-            for item in s.iterdir():
-                if item.name in _JUNK_NAMES:
+        counter = start_idx
+        errors: list[tuple[str, str, str]] = []
+        pool = self._copy_pool()
+        futures = {}
+        try:
+            for s, d in jobs:
+                # A cancelled install queues nothing more on the shared pool
+                if self.isInterruptionRequested():
+                    break
+                futures[pool.submit(copy_one, s, d)] = (s, d)
+            for future in as_completed(futures):
+                s, d = futures[future]
+                try:
+                    if not future.result():
+                        continue
+                except OSError as why:
+                    errors.append((s, d, str(why)))
                     continue
+                counter += 1
+                self._report_progress(os.path.basename(s), counter, total)
+        finally:
+            # Drop the queued copies and let running ones finish, so none
+            # outlive this item (the pool is shared with the next one) or
+            # write into a staging folder being removed after an error
+            for future in futures:
+                future.cancel()
+            wait(futures)
 
-                target = d / item.name
-                if item.is_dir():
-                    target.mkdir(parents=True, exist_ok=True)
-                    _copy_internal(item, target)
-                else:
-                    shutil.copy2(item, target, follow_symlinks=False)
-                    counter[0] += 1
-                    self.progress_update.emit(
-                        tr("installing_status", name=item.name), counter[0], total
-                    )
-
-        _copy_internal(src, dst)
+        if errors:
+            raise shutil.Error(errors)
 
     def _backup_configs(self, source: Path, backup_root: Path):
         """Recursively backup config files (everything except binaries)."""
+        backup_str = os.fspath(backup_root)
         try:
-            for path in source.rglob("*"):
-                if path.is_file() and path.suffix.lower() not in _BINARY_EXTENSIONS:
-                    try:
-                        rel_path = path.relative_to(source)
-                        backup_path = backup_root / rel_path
-                        backup_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(path, backup_path)
-                    except Exception:
-                        pass
+            for entry, rel_path in _walk_files(source):
+                if os.path.splitext(entry.name)[1].lower() in _BINARY_EXTENSIONS:
+                    continue
+                try:
+                    backup_path = os.path.join(backup_str, rel_path)
+                    os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+                    fast_copy(entry.path, backup_path)
+                except Exception:
+                    pass
         except Exception:
             pass
 
     def _restore_configs(self, backup_root: Path, target: Path):
         """Restore backed up config files, overwriting or merging with fresh ones."""
+        target_str = os.fspath(target)
         try:
-            for path in backup_root.rglob("*"):
-                if path.is_file():
-                    try:
-                        rel_path = path.relative_to(backup_root)
-                        target_path = target / rel_path
-                        # Ensure target dir exists (should, but safe check)
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        if target_path.exists():
-                            ext = path.suffix.lower()
-                            if ext == ".ini":
-                                self._merge_ini_files(path, target_path)
-                            elif ext == ".json":
-                                self._merge_json_files(path, target_path)
-                            elif ext == ".toml":
-                                self._merge_toml_files(path, target_path)
-                            else:
-                                shutil.copy2(path, target_path)
+            for entry, rel_path in _walk_files(backup_root):
+                try:
+                    path = entry.path
+                    target_path = os.path.join(target_str, rel_path)
+                    # Ensure target dir exists (should, but safe check)
+                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+                    if os.path.exists(target_path):
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext == ".ini":
+                            self._merge_ini_files(path, target_path)
+                        elif ext == ".json":
+                            self._merge_json_files(path, target_path)
+                        elif ext == ".toml":
+                            self._merge_toml_files(path, target_path)
                         else:
-                            shutil.copy2(path, target_path)
-                    except Exception:
-                        pass
+                            fast_copy(path, target_path)
+                    else:
+                        fast_copy(path, target_path)
+                except Exception:
+                    pass
         except Exception:
             pass
 
-    def _merge_ini_files(self, old_ini: Path, new_ini: Path):
+    def _merge_ini_files(self, old_ini: str | Path, new_ini: str | Path):
         """Merge old INI settings into the new INI file, preserving new structure & comments."""
         try:
             old_settings = {}
@@ -435,7 +800,7 @@ class InstallWorker(QThread):
             # Fallback to copy if merge fails
             shutil.copy2(old_ini, new_ini)
 
-    def _merge_json_files(self, old_json: Path, new_json: Path):
+    def _merge_json_files(self, old_json: str | Path, new_json: str | Path):
         """Merge old JSON settings into new JSON file (shallow merge)."""
         import json
 
@@ -467,7 +832,7 @@ class InstallWorker(QThread):
         except Exception:
             shutil.copy2(old_json, new_json)
 
-    def _merge_toml_files(self, old_toml: Path, new_toml: Path):
+    def _merge_toml_files(self, old_toml: str | Path, new_toml: str | Path):
         """Merge old TOML settings into new TOML file."""
         import tomlkit
 
@@ -508,6 +873,16 @@ class ModInstaller:
         self._log = logging.getLogger(__name__)
         # Track the last selected mod root path for metadata storage
         self._last_selected_mod_root_path: str | None = None
+        # Per-install memo of folder scans, keyed by os.fspath(folder)
+        self._detect_cache: dict[str, str] = {}
+        self._flags_cache: dict[str, tuple[bool, bool]] = {}
+        self._children_cache: dict[str, list[Path]] = {}
+        self._realpath_cache: dict[str, str] = {}
+        self._mods_dir_cache: Path | None = None
+        # Lower-cased mods dir entries (and DLL stems); rebuilt after installs
+        self._installed_index: set[str] | None = None
+        # Hook script modules loaded during the current install
+        self._hook_modules: dict[tuple[str, int, int], ModuleType] = {}
 
     def _run_worker_with_progress(self, worker, progress) -> bool:
         """Run worker and progress dialog. Returns true if successful, false if failed/cancelled."""
@@ -533,35 +908,28 @@ class ModInstaller:
         return progress
 
     @contextmanager
-    def _staging_dir(self):
-        """Context manager that yields a temporary staging directory path."""
-        temp_root = self._get_mods_dir().parent / ".me3_temp_extraction"
+    def staging_dir(self):
+        """Context manager that yields a temporary staging directory path.
+
+        Sources installed from inside it count as throwaway copies, so
+        install_mod moves them into place rather than copying them.
+        """
+        # Also used before an install starts (drag and drop), so re-read the
+        # mods dir rather than trust one cached by an earlier install
+        self._mods_dir_cache = None
+        temp_root = self._get_mods_dir().parent / _TEMP_DIR_NAME
         temp_root.mkdir(parents=True, exist_ok=True)
         with TemporaryDirectory(dir=str(temp_root)) as tmp_dir:
             yield Path(tmp_dir)
 
-    @staticmethod
-    def _copy_to_staging(
-        src: Path,
-        staged_path: Path,
-        copy_fn: Callable | None = None,
-    ) -> None:
-        """Copy a file or directory to a staging path."""
-        staged_path.parent.mkdir(parents=True, exist_ok=True)
-        if src.is_dir():
-            kwargs: dict = dict(
-                symlinks=False,
-                ignore_dangling_symlinks=True,
-                dirs_exist_ok=True,
-            )
-            if copy_fn is not None:
-                kwargs["copy_function"] = copy_fn
-            shutil.copytree(src, staged_path, **kwargs)
-        else:
-            if copy_fn is not None:
-                copy_fn(src, staged_path, follow_symlinks=False)
-            else:
-                shutil.copy2(src, staged_path, follow_symlinks=False)
+    def _is_staged(self, path: Path) -> bool:
+        """Return True if path lives in the scratch folder used by staging_dir.
+
+        Both sides are resolved, so a link inside the scratch folder that
+        points elsewhere doesn't count as staged.
+        """
+        staging_root = os.path.realpath(self._get_mods_dir().parent / _TEMP_DIR_NAME)
+        return os.path.realpath(path).startswith(staging_root + os.sep)
 
     def _base_script_context(self) -> dict:
         """Return the base context dict shared by all script hooks."""
@@ -584,13 +952,9 @@ class ModInstaller:
 
         Returns True if the hook was found and executed, False otherwise.
         """
-        import importlib.util
-
-        spec = importlib.util.spec_from_file_location("mod_hook", script_path)
-        if not spec or not spec.loader:
+        module = _load_hook_module(script_path, self._hook_modules)
+        if module is None:
             return False
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
         hook = getattr(module, hook_name, None)
         if hook:
             hook(context)
@@ -635,6 +999,7 @@ class ModInstaller:
         """
         # Reset the last selected path before each install
         self._last_selected_mod_root_path = None
+        self._clear_scan_caches()
 
         try:
             # Handle archives
@@ -653,15 +1018,16 @@ class ModInstaller:
                 self._show_error(tr("mod_source_not_found"))
                 return []
 
-            # Check for symlinks
-            if _contains_symlink(source):
+            # Reject linked sources before any unwrapping: a link followed here
+            # could make a folder outside the source the thing that is installed
+            if source.is_symlink() or _plan_copy(source)[3]:
                 self._show_error(tr("symlink_rejected_package_msg"))
                 return []
 
             # Use user-specified path if provided, otherwise auto-detect
             if mod_root_path:
                 user_root = source / mod_root_path
-                if user_root.exists() and user_root.is_dir():
+                if user_root.is_dir():
                     mod_root = user_root
                 else:
                     # Fall back to auto-detect if specified path doesn't exist
@@ -671,14 +1037,19 @@ class ModInstaller:
                 mod_root = self._find_mod_root(source)
 
             # Scan for ambiguous mod structures
-            candidates = self._scan_candidates(mod_root)
+            # Prioritize me3 profiles always (no prompt): stop scanning at the
+            # first one instead of classifying the remaining subfolders
+            candidates = []
+            me3_candidate = None
+            for candidate in self._iter_candidates(mod_root):
+                if candidate[1] == "me3":
+                    me3_candidate = candidate
+                    break
+                candidates.append(candidate)
             mod_type = "unknown"
 
-            # Prioritize me3 profiles always (no prompt)
-            me3_candidates = [c for c in candidates if c[1] == "me3"]
-
-            if me3_candidates:
-                mod_root, mod_type = me3_candidates[0]
+            if me3_candidate:
+                mod_root, mod_type = me3_candidate
             elif len(candidates) >= 1 and not mod_root_path:
                 # Install entire folder as container mod - no selection dialog needed
                 # Find the root candidate (if exists), otherwise use first candidate
@@ -705,55 +1076,78 @@ class ModInstaller:
             self._log.exception("Mod installation failed")
             self._show_error(tr("import_error_msg", error=str(e)))
             return []
+        finally:
+            self._clear_scan_caches()
 
     # =========================================================================
     # MOD TYPE DETECTION
     # =========================================================================
 
+    def _clear_scan_caches(self) -> None:
+        """Forget folder scans from a previous install."""
+        self._detect_cache.clear()
+        self._flags_cache.clear()
+        self._children_cache.clear()
+        self._realpath_cache.clear()
+        self._mods_dir_cache = None
+        self._installed_index = None
+        self._hook_modules.clear()
+
+    def _children(self, folder: Path) -> list[os.DirEntry]:
+        """Memoized _filter_children for the current install."""
+        key = os.fspath(folder)
+        children = self._children_cache.get(key)
+        if children is None:
+            children = self._children_cache[key] = _filter_children(folder)
+        return children
+
+    def _realpath(self, path: str | os.PathLike) -> str:
+        """Memoized os.path.realpath for the current install."""
+        key = os.fspath(path)
+        real = self._realpath_cache.get(key)
+        if real is None:
+            real = self._realpath_cache[key] = os.path.realpath(key)
+        return real
+
     def _find_mod_root(self, folder: Path) -> Path:
         """
-        Recursively find the real mod root by unwrapping single-child folders.
+        Find the real mod root by unwrapping single-child folders.
         Stops if it hits a folder with multiple children or mod files.
         """
-        # Priority Check: If the current folder is already a valid mod package (especially me3),
-        # return it immediately. Do not unwrap single children if the parent is already a valid mod.
-        # This prevents drilling into the content of a me3 profile mod.
-        detected_type = self._detect_mod_type(folder)
-        if detected_type in ("me3", "native", "package"):
-            return folder
-
-        children = _filter_children(folder)
-
-        if not children:
-            return folder
-
-        # If single child folder, check if it's the real mod
-        if len(children) == 1 and children[0].is_dir():
-            child = children[0]
-            # Recursively find root in the child
-            return self._find_mod_root(child)
-
-        return folder
-
-    def _scan_candidates(self, folder: Path) -> list[tuple[Path, str]]:
-        """Find all viable mod candidates in folder."""
-        candidates = []
-
+        while True:
+            # Priority Check: If the current folder is already a valid mod package (especially me3),
+            # return it immediately. Do not unwrap single children if the parent is already a valid mod.
+            # This prevents drilling into the content of a me3 profile mod.
+            detected_type = self._detect_mod_type(folder)
+            if detected_type in ("me3", "native", "package"):
+                return folder
+
+            children = self._children(folder)
+
+            # If single child folder, it may be a wrapper around the real mod;
+            # a linked child is never unwrapped into
+            if len(children) != 1 or not children[0].is_dir(follow_symlinks=False):
+                return folder
+            folder = Path(children[0].path)
+
+    def _iter_candidates(self, folder: Path) -> Iterator[tuple[Path, str]]:
+        """Yield viable mod candidates in folder, root first, lazily."""
         # Check root
         root_type = self._detect_mod_type(folder)
         # Use simple detection logic to avoid infinite recursion if _detect_mod_type calls this (it doesn't)
         if root_type in ("package", "native", "me3"):
-            candidates.append((folder, root_type))
+            yield folder, root_type
 
             # If root is a .me3 profile, it defines the entire mod structure.
             # We should NOT scan subfolders for other candidates, as they are likely
             # parts of the profile mod (e.g. DLLs or game folders)
             if root_type == "me3":
-                return candidates
+                return
 
         # Check immediate subfolders
-        for child in _filter_children(folder):
-            if child.is_dir():
+        for entry in self._children(folder):
+            if entry.is_dir():
+                child = Path(entry.path)
                 t = self._detect_mod_type(child)
 
                 # Filter out redundant candidates
@@ -763,12 +1157,20 @@ class ModInstaller:
                     continue
 
                 if t in ("package", "native", "me3"):
-                    candidates.append((child, t))
-
-        return candidates
+                    yield child, t
 
     def _detect_mod_type(
         self, folder: Path
+    ) -> Literal["me3", "native", "package", "unknown"]:
+        """Memoized _classify_folder for the current install."""
+        key = os.fspath(folder)
+        mod_type = self._detect_cache.get(key)
+        if mod_type is None:
+            mod_type = self._detect_cache[key] = self._classify_folder(folder)
+        return mod_type
+
+    def _classify_folder(
+        self, folder: Path
     ) -> Literal["me3", "native", "package", "unknown"]:
         """
         Detect what type of mod this folder contains.
@@ -778,24 +1180,30 @@ class ModInstaller:
         2. native - Has DLLs, no game asset folders
         3. package - Has game asset folders or regulation.bin
         """
-        children = _filter_children(folder)
+        # A parent's walk already covered its subfolders
+        key = os.fspath(folder)
+        if key not in self._flags_cache:
+            self._flags_cache.update(_scan_flags(folder))
+        has_me3, has_nested_dll = self._flags_cache[key]
 
         # Priority 1: Has .me3 profile
-        me3_files = list(folder.rglob("*.me3"))
-        if me3_files:
-            return "me3"
-        if me3_files:
+        if has_me3:
             return "me3"
 
+        children = self._children(folder)
+
         # Check for DLLs and game folders
-        dlls = [c for c in children if c.is_file() and c.suffix.lower() == ".dll"]
-        has_assets = (
-            any(c.is_dir() and c.name.lower() in ACCEPTABLE_FOLDERS for c in children)
-            or (folder / "regulation.bin").exists()
+        has_dlls = any(
+            c.name.lower().endswith(".dll") and c.is_file() for c in children
+        )
+        has_assets = any(
+            c.name.lower() == "regulation.bin"
+            or (c.name.lower() in _ACCEPTABLE_FOLDER_SET and c.is_dir())
+            for c in children
         )
 
         # Priority 2: Native mod (DLL-only)
-        if dlls and not has_assets:
+        if has_dlls and not has_assets:
             return "native"
 
         # Priority 3: Package mod
@@ -803,8 +1211,7 @@ class ModInstaller:
             return "package"
 
         # Check for nested DLLs (e.g., SeamlessCoop/nrsc.dll)
-        nested_dlls = list(folder.rglob("*.dll"))
-        if nested_dlls:
+        if has_nested_dll:
             # Has DLLs somewhere inside - treat as native mod
             return "native"
 
@@ -820,7 +1227,7 @@ class ModInstaller:
         options: InstallOptions,
     ) -> list[str]:
         """Extract archive and install contents."""
-        with self._staging_dir() as tmp:
+        with self.staging_dir() as tmp:
             extract_dir = Path(tmp) / "extract"
             extract_dir.mkdir(parents=True, exist_ok=True)
 
@@ -870,7 +1277,11 @@ class ModInstaller:
     ) -> list[str]:
         """Install mod using its .me3 profile."""
         # Ensure we only pick up actual files, not directories
-        me3_files = [p for p in mod_root.rglob("*.me3") if p.is_file()]
+        me3_files = [
+            Path(entry.path)
+            for entry in _scandir_recursive(mod_root)
+            if entry.name.lower().endswith(".me3") and entry.is_file()
+        ]
 
         if not me3_files:
             self._log.error(
@@ -934,8 +1345,7 @@ class ModInstaller:
             self._register_folder_mod(mod_name, dest)
 
         # Auto-register all DLLs within the folder
-        for dll in dest.rglob("*.dll"):
-            self._register_native_mod(dll)
+        self._register_native_mods(list(_iter_dlls(dest)))
 
         if load_mods:
             self.game_page.load_mods()
@@ -943,7 +1353,10 @@ class ModInstaller:
 
     def _install_staged_items(self, items_to_install: list[tuple[Path, Path]]) -> bool:
         """
-        Stage and install a list of items with robust path handling.
+        Install a list of items with robust path handling.
+
+        InstallWorker already builds each item in a temp dir next to its
+        destination and swaps it in, so sources are not staged separately.
 
         Args:
             items_to_install: List of (source_absolute_path, destination_relative_path)
@@ -954,39 +1367,12 @@ class ModInstaller:
         if not items_to_install:
             return False
 
-        with self._staging_dir() as tmp_dir:
-            staged_items = []
-
-            def do_staging():
-                def copy_with_cancel(src_f, dst_f, **kwargs):
-                    if QThread.currentThread().isInterruptionRequested():
-                        raise InterruptedError("Staging cancelled")
-                    return shutil.copy2(src_f, dst_f, **kwargs)
-
-                for src, dest_rel in items_to_install:
-                    if QThread.currentThread().isInterruptionRequested():
-                        raise InterruptedError("Staging cancelled")
-
-                    dest_rel_path = Path(dest_rel)
-                    staged_path = tmp_dir / dest_rel_path
-
-                    self._copy_to_staging(src, staged_path, copy_fn=copy_with_cancel)
-                    staged_items.append((staged_path, dest_rel_path))
-
-            progress = self._create_progress_dialog("staging_status")
-
-            worker = ActionWorker(do_staging)
-            if not self._run_worker_with_progress(worker, progress):
-                if (
-                    "cancelled" in worker.error_msg.lower()
-                    or "cancel" in worker.error_msg.lower()
-                ):
-                    self._log.info("Staging cancelled by user.")
-                else:
-                    self._log.exception("Staging failed: %s", worker.error_msg)
-                return False
-
-            return self._copy_with_progress(staged_items)
+        # Sources already in our scratch folder (e.g. an extracted archive) are
+        # throwaway copies on the mods filesystem: move them instead of copying
+        return self._copy_with_progress(
+            [(src, Path(dest_rel)) for src, dest_rel in items_to_install],
+            consume_sources=all(self._is_staged(src) for src, _ in items_to_install),
+        )
 
     def _handle_profile_import(
         self,
@@ -998,9 +1384,17 @@ class ModInstaller:
         """
         Import mod using .me3 profile.
         """
+        game_name = self.game_page.game_name
+        config_manager = self.config_manager
+        # Also reached directly from GamePage, outside install_mod
+        self._realpath_cache.clear()
+        self._mods_dir_cache = None
+        self._installed_index = None
+        self._hook_modules.clear()
         try:
-            with open(profile_file, "r", encoding="utf-8") as f:
-                raw_data = tomlkit.parse(f.read())
+            # Read-only: plain dicts are all we need, no formatting to keep
+            with open(profile_file, "rb") as f:
+                raw_data = tomllib.load(f)
                 from me3_manager.core.profiles import ProfileConverter
 
                 profile_data = ProfileConverter.normalize(raw_data)
@@ -1011,9 +1405,7 @@ class ModInstaller:
 
             # Show merge/replace dialog
             dialog = QDialog(self.game_page)
-            dialog.setWindowTitle(
-                tr("import_profile_mods_title", game_name=self.game_page.game_name)
-            )
+            dialog.setWindowTitle(tr("import_profile_mods_title", game_name=game_name))
             dialog.setModal(True)
             layout = QVBoxLayout()
             layout.addWidget(QLabel(tr("import_profile_mods_desc")))
@@ -1098,7 +1490,10 @@ class ModInstaller:
                     items_to_install.append((pkg_abs, dest_name))
                 final_folder_names.append(dest_name)
 
-            # Stage and install
+            # Collect native files to install and, in the same pass, the
+            # registrations to apply once they are in place. Paths are read
+            # after processing since natives inside a package get rewritten.
+            native_registrations: list[tuple[Path, dict]] = []
             for native in profile_data.get("natives", []):
                 if not isinstance(native, dict):
                     continue
@@ -1111,6 +1506,19 @@ class ModInstaller:
                     jail_dir=import_folder,
                 )
 
+                mod_path_str = native.get("path")
+                if mod_path_str:
+                    # If relative, join with mods_dir
+                    if os.path.isabs(mod_path_str):
+                        full_path = Path(mod_path_str)
+                    else:
+                        full_path = mods_dir / mod_path_str
+                    # All settings (load_early, initializer, etc.)
+                    settings = {
+                        k: v for k, v in native.items() if k not in ("path", "enabled")
+                    }
+                    native_registrations.append((full_path, settings))
+
             if (
                 not items_to_install
                 and not final_folder_names
@@ -1121,52 +1529,36 @@ class ModInstaller:
                 self.game_page.status_label.setText(tr("import_cancelled_status"))
                 return []
 
-            # Stage and install
+            # Install straight from the profile folder; entries may overlap
+            # (a package and a native inside it), so sources are never consumed.
+            # Several natives can list the same config, so drop repeated pairs.
             if items_to_install:
-                with self._staging_dir() as tmp_dir:
-                    staged_items = []
-                    for src, dest_name in items_to_install:
-                        staged_path = tmp_dir / dest_name
-                        self._copy_to_staging(src, staged_path)
-                        dest_rel = (
-                            dest_name
-                            if isinstance(dest_name, Path)
-                            else Path(dest_name)
+                self._copy_with_progress(
+                    list(
+                        dict.fromkeys(
+                            (src, Path(dest_name))
+                            for src, dest_name in items_to_install
                         )
-                        staged_items.append((staged_path, dest_rel))
-
-                    self._copy_with_progress(staged_items)
+                    )
+                )
 
             # Register packages
-            for folder_name in final_folder_names:
-                self._register_folder_mod(folder_name, mods_dir / folder_name)
-
-            # Register natives and apply settings (including load_early)
-            for native in profile_data.get("natives", []):
-                if isinstance(native, dict) and native.get("path"):
-                    mod_path_str = native["path"]
-                    # If relative, join with mods_dir
-                    if not Path(mod_path_str).is_absolute():
-                        full_path = mods_dir / mod_path_str
-                    else:
-                        full_path = Path(mod_path_str)
-
-                    if full_path.exists():
-                        # Enable it
-                        self.config_manager.set_mod_enabled(
-                            self.game_page.game_name, str(full_path), True
+            self._register_folder_mods(final_folder_names)
+
+            # Register natives and apply settings (including load_early);
+            # DLLs are enabled together so the profile is written once
+            native_dlls: list[tuple[str, dict]] = []
+            for full_path, settings in native_registrations:
+                if full_path.is_dir():
+                    config_manager.set_mod_enabled(game_name, str(full_path), True)
+                    if settings:
+                        config_manager.enable_native_with_options(
+                            game_name, str(full_path), settings
                         )
-
-                        # Apply all settings (load_early, initializer, etc.)
-                        settings = {
-                            k: v
-                            for k, v in native.items()
-                            if k not in ("path", "enabled")
-                        }
-                        if settings:
-                            self.config_manager.enable_native_with_options(
-                                self.game_page.game_name, str(full_path), settings
-                            )
+                elif full_path.exists():
+                    native_dlls.append((str(full_path), settings))
+            if native_dlls:
+                config_manager.enable_natives_with_options(game_name, native_dlls)
 
             # Run post-install script if approved
             if script_approved and install_script:
@@ -1196,7 +1588,9 @@ class ModInstaller:
                 self._merge_user_values_into_profile(profile_data, user_values)
 
             # Apply configuration overrides
-            mods_dir = self._get_mods_dir()
+            # Resolved once; every override path is checked against it
+            mods_dir_str = os.fspath(mods_dir)
+            mods_dir_prefix = os.path.join(os.path.realpath(mods_dir_str), "")
 
             def _apply_configs(entries):
                 for entry in entries:
@@ -1226,7 +1620,7 @@ class ModInstaller:
 
                         for config_rel in configs:
                             # path is relative to mods_dir
-                            config_path = mods_dir / config_rel
+                            config_path = os.path.join(mods_dir_str, config_rel)
 
                             # Prepare merged overrides for this specific file
                             # Start with global overrides (DEEP COPY to avoid sharing mutable inner dicts)
@@ -1258,9 +1652,12 @@ class ModInstaller:
 
                             # Simple security check to prevent escaping mods_dir
                             try:
-                                config_path.resolve().relative_to(mods_dir.resolve())
+                                if not os.path.realpath(config_path).startswith(
+                                    mods_dir_prefix
+                                ):
+                                    raise ValueError(config_rel)
                                 ConfigApplicator.apply_ini_overrides(
-                                    config_path, merged_overrides
+                                    Path(config_path), merged_overrides
                                 )
                             except Exception:
                                 self._log.warning(
@@ -1283,9 +1680,9 @@ class ModInstaller:
                 msg.setText(tr("import_complete_success_header"))
                 msg.setIcon(QMessageBox.Icon.Information)
 
-            msg.exec()
-
+            # Reload first so the list is already current behind the summary
             self.game_page.load_mods()
+            msg.exec()
             return final_folder_names
 
         except Exception as e:
@@ -1304,31 +1701,51 @@ class ModInstaller:
         - https://www.nexusmods.com/eldenring/mods/123
         - https://nexusmods.com/eldenring/mods/123
         """
-        import re
-
-        pattern = r"(?:https?://)?(?:www\.)?nexusmods\.com/([^/]+)/mods/(\d+)"
-        match = re.search(pattern, url)
+        match = _NEXUS_URL_RE.search(url)
         if match:
             game_domain = match.group(1)
             mod_id = int(match.group(2))
             return (game_domain, mod_id)
         return None
 
+    def _build_installed_index(self) -> set[str]:
+        """Collect lower-cased mods dir entry names, plus the stems of DLLs."""
+        index: set[str] = set()
+        try:
+            with os.scandir(self._get_mods_dir()) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    index.add(name)
+                    stem, ext = os.path.splitext(name)
+                    if ext == ".dll":
+                        index.add(stem)
+        except OSError:
+            pass
+        return index
+
     def _is_mod_installed(self, mod_name_hint: str) -> bool:
         """Check if a mod is already installed by checking the mods directory."""
-        mods_dir = self._get_mods_dir()
-        if not mods_dir.exists():
-            return False
-
         # Check if any folder or DLL matches the mod name hint (case-insensitive)
-        mod_name_lower = mod_name_hint.lower()
-        for item in mods_dir.iterdir():
-            if item.name.lower() == mod_name_lower:
-                return True
-            # Also check DLLs
-            if item.suffix.lower() == ".dll" and item.stem.lower() == mod_name_lower:
-                return True
-        return False
+        if self._installed_index is None:
+            self._installed_index = self._build_installed_index()
+        return mod_name_hint.lower() in self._installed_index
+
+    @staticmethod
+    def _dep_install_name(dep: dict) -> str | None:
+        """Mods dir name a nexus dependency installs to, if known.
+
+        For packages that is the install_name or mod_folder. For natives it is
+        the DLL file name, which _installed_index lists alongside its stem;
+        the folders leading up to it say nothing about the installed name.
+        Returns None when the name can't be told, so nothing is guessed.
+        """
+        entry = dep["entry"]
+        if dep["type"] == "package":
+            name = entry.get("install_name") or entry.get("mod_folder")
+            return str(name) if name else None
+        path = str(entry.get("path") or "").replace("\\", "/").strip("/")
+        name = path.rpartition("/")[2]
+        return name if name.lower().endswith(".dll") else None
 
     def _handle_nexus_dependencies(self, profile_data: dict) -> tuple[bool, list[str]]:
         """Check for and download missing mods from nexus_link entries.
@@ -1369,7 +1786,15 @@ class ModInstaller:
         _process_entries(profile_data.get("natives", []), "native")
         _process_entries(profile_data.get("packages", []), "package")
 
-        if not nexus_deps:
+        # Filter to only mods that aren't already installed
+        missing_deps = [
+            dep
+            for dep in nexus_deps
+            if not (
+                (name := self._dep_install_name(dep)) and self._is_mod_installed(name)
+            )
+        ]
+        if not missing_deps:
             return True, []
 
         # Check if we have nexus service available
@@ -1383,26 +1808,28 @@ class ModInstaller:
             QMessageBox.warning(
                 self.game_page,
                 tr("nexus_api_key_missing_status"),
-                tr("nexus_dependencies_missing_api_key", count=len(nexus_deps)),
+                tr("nexus_dependencies_missing_api_key", count=len(missing_deps)),
                 QMessageBox.StandardButton.Ok,
             )
             # Always cancel - user must log in to proceed
             return False, []
 
-        # Filter to only mods that aren't already installed
-        # For now, we'll just show all and let download_from_nexus handle duplicates
-        missing_deps = nexus_deps
-
         # Fetch mod info upfront to show names in the dialog
         # This also caches the mod info for use during download
-        for dep in missing_deps:
+        def _fetch_mod_info(dep):
             try:
-                mod = nexus_service.get_mod(dep["game_domain"], dep["mod_id"])
-                dep["mod_info"] = mod
-                dep["mod_name"] = mod.name or f"Mod #{dep['mod_id']}"
+                return nexus_service.get_mod(dep["game_domain"], dep["mod_id"])
             except Exception:
-                dep["mod_info"] = None
-                dep["mod_name"] = f"Mod #{dep['mod_id']}"
+                return None
+
+        # The lookups are independent API calls, so overlap their latency
+        with ThreadPoolExecutor(
+            max_workers=min(_NEXUS_FETCH_WORKERS, len(missing_deps))
+        ) as pool:
+            mod_infos = list(pool.map(_fetch_mod_info, missing_deps))
+        for dep, mod in zip(missing_deps, mod_infos, strict=True):
+            dep["mod_info"] = mod
+            dep["mod_name"] = (mod and mod.name) or f"Mod #{dep['mod_id']}"
 
         # Show confirmation dialog with mod names and file names
         msg_lines = [tr("nexus_dependencies_found", count=len(missing_deps)), ""]
@@ -1426,6 +1853,8 @@ class ModInstaller:
         if reply != QMessageBox.StandardButton.Yes:
             return False, []
 
+        mods_dir = self._get_mods_dir()
+        mods_dir_str = os.fspath(mods_dir)
         try:
             # Download each missing dependency
             for dep in missing_deps:
@@ -1488,17 +1917,14 @@ class ModInstaller:
                         # Resolve the path for the entry in the profile
                         if dep["type"] == "native":
                             # For natives, find the DLL inside the mod folder
-                            mods_dir = self._get_mods_dir()
-                            mod_path = mods_dir / mod_name
-                            dll_files = list(mod_path.rglob("*.dll"))
-                            if dll_files:
-                                try:
-                                    rel_dll = dll_files[0].relative_to(mods_dir)
-                                    dep["entry"]["path"] = str(rel_dll).replace(
-                                        "\\", "/"
-                                    )
-                                except Exception:
-                                    pass
+                            # Only the first DLL is used, so stop walking there
+                            first_dll = next(_iter_dlls(mods_dir / mod_name), None)
+                            if first_dll:
+                                # The walk started under mods_dir, so the
+                                # relative part is a plain slice
+                                dep["entry"]["path"] = first_dll[
+                                    len(mods_dir_str) + 1 :
+                                ].replace(os.sep, "/")
                         else:
                             # For packages, the path is just the folder name
                             dep["entry"]["path"] = mod_name
@@ -1541,31 +1967,36 @@ class ModInstaller:
         native: dict,
         profile_base: Path,
         package_source_map: dict[Path, str],
-        items_to_install: list[tuple[Path, Path]],
+        items_to_install: list[tuple[Path, str]],
         jail_dir: Path | None = None,
     ):
-        """Helper to process a single native entry during profile import."""
+        """Helper to process a single native entry during profile import.
+
+        Paths are handled as "/"-separated strings; a Path is only built for
+        sources that actually get installed.
+        """
         has_path = bool(native.get("path"))
         if not has_path and not native.get("config"):
             return
 
         nat_abs = None
-        nat_rel = None
+        nat_rel = ""
         if has_path:
-            nat_rel = Path(str(native["path"]).replace("\\", "/"))
+            nat_rel = str(native["path"]).replace("\\", "/")
             nat_abs = self._safe_join(profile_base, nat_rel, jail_dir=jail_dir)
 
         # 1. Process DLL installation if we have a valid source path
-        if nat_abs and nat_abs.is_file() and nat_abs.suffix.lower() == ".dll":
+        if nat_abs and nat_abs.lower().endswith(".dll") and os.path.isfile(nat_abs):
             found_in_package = self._is_in_package(
                 nat_abs, package_source_map, native, is_config=False
             )
 
             if not found_in_package:
-                if ".." in nat_rel.parts:
-                    items_to_install.append((nat_abs, Path(nat_abs.name)))
+                if ".." in nat_rel.split("/"):
+                    dest_rel = os.path.basename(nat_abs)
                 else:
-                    items_to_install.append((nat_abs, nat_rel))
+                    dest_rel = nat_rel
+                items_to_install.append((Path(nat_abs), dest_rel))
 
         # 2. Handle associated config
         # Explicit config field
@@ -1577,47 +2008,53 @@ class ModInstaller:
             if not cfg_path_str:
                 continue
 
-            cfg_rel = Path(str(cfg_path_str).replace("\\", "/"))
+            cfg_rel = str(cfg_path_str).replace("\\", "/")
             cfg_abs = self._safe_join(profile_base, cfg_rel, jail_dir=jail_dir)
 
-            if cfg_abs and cfg_abs.is_file():
+            if cfg_abs and os.path.isfile(cfg_abs):
                 if not self._is_in_package(cfg_abs, package_source_map):
-                    if ".." in cfg_rel.parts:
-                        items_to_install.append((cfg_abs, Path(cfg_abs.name)))
+                    if ".." in cfg_rel.split("/"):
+                        dest_rel = os.path.basename(cfg_abs)
                     else:
-                        items_to_install.append((cfg_abs, cfg_rel))
+                        dest_rel = cfg_rel
+                    items_to_install.append((Path(cfg_abs), dest_rel))
 
         # Implicit config dir (only if we have a native path and no explicit configs)
         if nat_abs and not configs:
-            cfg_dir = nat_abs.parent / nat_abs.stem
-            if cfg_dir.is_dir():
+            cfg_dir = os.path.splitext(nat_abs)[0]
+            if os.path.isdir(cfg_dir):
                 if not self._is_in_package(cfg_dir, package_source_map):
-                    rel_parent = nat_rel.parent
-                    if ".." in rel_parent.parts:
-                        items_to_install.append((cfg_dir, Path(cfg_dir.name)))
+                    cfg_name = os.path.basename(cfg_dir)
+                    rel_parent = nat_rel.rpartition("/")[0]
+                    if rel_parent and ".." not in rel_parent.split("/"):
+                        dest_rel = f"{rel_parent}/{cfg_name}"
                     else:
-                        items_to_install.append((cfg_dir, rel_parent / cfg_dir.name))
+                        dest_rel = cfg_name
+                    items_to_install.append((Path(cfg_dir), dest_rel))
 
     def _is_in_package(
         self,
-        item_path: Path,
+        item_path: str | Path,
         package_source_map: dict[Path, str],
         native_entry: dict | None = None,
         is_config: bool = True,
     ) -> bool:
-        """Check if an item is inside any of the packages being installed."""
+        """Check if an item is inside any of the packages being installed.
+
+        Both item_path and the map keys come from _safe_join and are already
+        real paths, so plain string prefix checks are enough.
+        """
+        item_str = os.fspath(item_path)
         for pkg_src, pkg_dest_name in package_source_map.items():
-            try:
-                if item_path == pkg_src or item_path.is_relative_to(pkg_src):
-                    # It is inside this package!
-                    if not is_config and native_entry:
-                        # Update profile path for natives
-                        rel_inside_pkg = item_path.relative_to(pkg_src)
-                        new_dest_path = Path(pkg_dest_name) / rel_inside_pkg
-                        native_entry["path"] = str(new_dest_path).replace("\\", "/")
-                    return True
-            except Exception:
-                continue
+            src_str = os.fspath(pkg_src)
+            if item_str == src_str or item_str.startswith(src_str + os.sep):
+                # It is inside this package!
+                if not is_config and native_entry:
+                    # Update profile path for natives
+                    rel_inside_pkg = item_str[len(src_str) + 1 :]
+                    new_dest_path = Path(pkg_dest_name) / rel_inside_pkg
+                    native_entry["path"] = str(new_dest_path).replace("\\", "/")
+                return True
         return False
 
     def _collect_user_prompts(self, profile_data: dict) -> list[dict]:
@@ -1693,14 +2130,9 @@ class ModInstaller:
 
     def _sanitize_mod_name(self, name: str) -> str:
         """Sanitize mod name to be valid for Windows filesystem."""
-        # Replace forbidden chars with underscore, but keep spaces
-        name = re.sub(r'[<>:"/\\|?*]', "_", name)
-        # Remove leading/trailing dots and spaces
-        name = name.strip(". ")
-        # Truncate to reasonable length
-        if len(name) > 60:
-            name = name[:60]
-        return name
+        # Replace forbidden chars with underscore (keeping spaces), drop
+        # leading/trailing dots and spaces, and truncate to a reasonable length
+        return name.translate(_FORBIDDEN_TRANSLATION).strip(". ")[:60]
 
     def _resolve_mod_name(
         self, mod_name_hint: str | None, fallback_name: str
@@ -1731,8 +2163,12 @@ class ModInstaller:
         return mod_name.strip()
 
     def _get_mods_dir(self) -> Path:
-        """Get the mods directory for the current game."""
-        return self.config_manager.get_mods_dir(self.game_page.game_name)
+        """Get the mods directory for the current game, cached per install."""
+        if self._mods_dir_cache is None:
+            self._mods_dir_cache = self.config_manager.get_mods_dir(
+                self.game_page.game_name
+            )
+        return self._mods_dir_cache
 
     def _resolve_package_source(
         self, pkg: dict, profile_base: Path, jail_dir: Path | None = None
@@ -1744,22 +2180,30 @@ class ModInstaller:
         pkg_rel_path = pkg.get("source") or pkg.get("path")
         # Handle mod_folder if present
         if pkg.get("mod_folder"):
-            pkg_rel_path = str(Path(pkg_rel_path) / pkg.get("mod_folder"))
+            pkg_rel_path = os.path.join(pkg_rel_path, pkg["mod_folder"])
 
-        return self._safe_join(profile_base, Path(pkg_rel_path), jail_dir=jail_dir)
+        result = self._safe_join(profile_base, pkg_rel_path, jail_dir=jail_dir)
+        return Path(result) if result else None
 
     def _safe_join(
-        self, base: Path, child: Path, jail_dir: Path | None = None
-    ) -> Path | None:
-        """Safely join paths, preventing traversal attacks while allowing expected relative navigation."""
+        self, base: Path, child: str | Path, jail_dir: Path | None = None
+    ) -> str | None:
+        """Safely join paths, preventing traversal attacks while allowing expected relative navigation.
+
+        Returns the resolved path as a string, or None if it escapes the jail.
+        """
         try:
-            if child.is_absolute():
+            if Path(child).is_absolute():
+                return None
+            candidate = os.path.realpath(os.path.join(base, child))
+
+            # Ensure candidate does not escape the restriction jail; the jail
+            # is the same for every entry of a profile, so resolve it once
+            restriction = self._realpath(jail_dir if jail_dir else base)
+            if os.path.normcase(
+                os.path.commonpath((candidate, restriction))
+            ) != os.path.normcase(restriction):
                 return None
-            candidate = (base / child).resolve()
-
-            # Ensure candidate does not escape the restriction jail
-            restriction = jail_dir.resolve() if jail_dir else base.resolve()
-            candidate.relative_to(restriction)
 
             return candidate
         except Exception:
@@ -1782,13 +2226,30 @@ class ModInstaller:
         except Exception:
             return False
 
-    def _register_native_mod(self, dll_path: Path) -> bool:
-        """Register a DLL mod in config and enable it."""
+    def _register_folder_mods(self, folder_names: list[str]) -> bool:
+        """Register folder mods in config and enable them in one profile write."""
+        if not folder_names:
+            return False
+        game_name = self.game_page.game_name
+        mods_dir = self._get_mods_dir()
         try:
-            self.config_manager.set_mod_enabled(
-                self.game_page.game_name, str(dll_path), True
+            dest_paths = []
+            for folder_name in folder_names:
+                dest_path = str(mods_dir / folder_name)
+                self.config_manager.add_folder_mod(game_name, folder_name, dest_path)
+                dest_paths.append(dest_path)
+            return self.config_manager.set_mods_enabled(game_name, dest_paths, True)
+        except Exception:
+            return False
+
+    def _register_native_mods(self, dll_paths: list[str]) -> bool:
+        """Register DLL mods in config and enable them in one profile write."""
+        if not dll_paths:
+            return False
+        try:
+            return self.config_manager.set_natives_enabled(
+                self.game_page.game_name, dll_paths, True
             )
-            return True
         except Exception:
             return False
 
@@ -1851,8 +2312,20 @@ class ModInstaller:
         except Exception:
             pass
 
-    def _copy_with_progress(self, items: list[Path | tuple[Path, Path]]) -> bool:
-        """Copy items with progress dialog."""
+    def _copy_with_progress(
+        self,
+        items: list[Path | tuple[Path, Path]],
+        *,
+        consume_sources: bool = False,
+    ) -> bool:
+        """Install items into the mods dir with progress dialog.
+
+        consume_sources: the sources are throwaway copies that may be moved
+        into place (see InstallWorker).
+        """
+        if not items:
+            return False
+
         mods_dir = self._get_mods_dir()
 
         # Helper to get destination name for conflict check
@@ -1861,43 +2334,66 @@ class ModInstaller:
                 return str(item[1])
             return item.name
 
-        # Check for conflicts
+        # Resolve each destination name once for both the check and the filter
+        named_items = [(get_dest_name(p), p) for p in items]
+
         # Check for conflicts
         conflicts = []
         config_conflicts = []
 
-        for p in items:
-            name = get_dest_name(p)
-            target = mods_dir / name
-            if target.exists():
-                # Check if it's a specific config file
-                # If target is a file, and extension is NOT a binary -> Treat as config/user data
-                if target.is_file() and target.suffix.lower() not in _BINARY_EXTENSIONS:
-                    config_conflicts.append(name)
-                else:
-                    conflicts.append(name)
-
-        # Handle messages
-        msgs = []
-        if conflicts:
-            msgs.append(tr("overwrite_dll_confirm_text"))
-            msgs.extend(f"- {name}" for name in conflicts)
-            msgs.append("")
-
-        if config_conflicts:
-            msgs.append(tr("shipped_configs_found_header"))
-            for name in config_conflicts:
-                # Try to extract mod name if possible (first folder of path)
-                p = Path(name)
-                if len(p.parts) > 1:
-                    msgs.append(
-                        tr("shipped_config_entry_fmt", config=p.name, mod=p.parts[0])
-                    )
-                else:
-                    msgs.append(f"- {name}")
-            msgs.append(tr("use_shipped_config_question"))
+        # One listing of the mods dir answers the check for top-level names
+        try:
+            with os.scandir(mods_dir) as it:
+                existing = {os.path.normcase(e.name): e for e in it}
+        except OSError:
+            existing = {}
+
+        def target_is_file(name: str) -> bool | None:
+            """None if the target doesn't exist, else whether it is a file."""
+            if os.sep not in name and not (os.altsep and os.altsep in name):
+                entry = existing.get(os.path.normcase(name))
+                if entry is None:
+                    return None
+                try:
+                    return entry.is_file()
+                except OSError:
+                    return None
+            # Nested path: one stat answers both "exists" and "is a file"
+            try:
+                return stat.S_ISREG(os.stat(os.path.join(mods_dir, name)).st_mode)
+            except (OSError, ValueError):
+                return None
 
+        for name, _item in named_items:
+            is_file = target_is_file(name)
+            if is_file is None:
+                continue
+            # If target is a file, and extension is NOT a binary -> Treat as config/user data
+            if is_file and os.path.splitext(name)[1].lower() not in _BINARY_EXTENSIONS:
+                config_conflicts.append(name)
+            else:
+                conflicts.append(name)
+
+        # Only build the message and ask when something would be overwritten
         if conflicts or config_conflicts:
+            msgs = []
+            if conflicts:
+                msgs.append(tr("overwrite_dll_confirm_text"))
+                msgs.extend(f"- {name}" for name in conflicts)
+                msgs.append("")
+
+            if config_conflicts:
+                msgs.append(tr("shipped_configs_found_header"))
+                entry_fmt = tr("shipped_config_entry_fmt")
+                for name in config_conflicts:
+                    # Try to extract mod name if possible (first folder of path)
+                    p = Path(name)
+                    if len(p.parts) > 1:
+                        msgs.append(entry_fmt.format(config=p.name, mod=p.parts[0]))
+                    else:
+                        msgs.append(f"- {name}")
+                msgs.append(tr("use_shipped_config_question"))
+
             reply = QMessageBox.question(
                 self.game_page,
                 tr("confirm_overwrite_title"),
@@ -1906,8 +2402,8 @@ class ModInstaller:
             )
             if reply == QMessageBox.StandardButton.No:
                 # Filter out all conflicts
-                all_conflicts = set(conflicts + config_conflicts)
-                items = [p for p in items if get_dest_name(p) not in all_conflicts]
+                all_conflicts = {*conflicts, *config_conflicts}
+                items = [p for name, p in named_items if name not in all_conflicts]
 
         if not items:
             return False
@@ -1927,7 +2423,7 @@ class ModInstaller:
         progress.setAutoClose(False)
         progress.setAutoReset(False)
 
-        worker = InstallWorker(items, mods_dir)
+        worker = InstallWorker(items, mods_dir, consume_sources=consume_sources)
 
         def on_progress(status, current, total):
             progress.setLabelText(status)
@@ -1945,6 +2441,8 @@ class ModInstaller:
         worker.start()
         progress.exec()
         worker.wait()
+        # The mods dir changed; rebuild the index on next use
+        self._installed_index = None
 
         if worker.errors:
             QMessageBox.warning(
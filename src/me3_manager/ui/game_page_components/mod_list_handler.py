@@ -6,10 +6,14 @@ It is responsible for loading mod data, applying filters and search queries,
 and generating the `ModItem` widgets for display.
 """
 
+import os
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QPushButton
 
 from me3_manager.core.mod_manager import ModStatus, ModType
 from me3_manager.ui.mod_item import ModItem
@@ -20,11 +24,114 @@ if TYPE_CHECKING:
     from me3_manager.ui.game_page_components import GamePage
 
 
+@dataclass(slots=True)
+class ModDisplayInfo:
+    """What the mod list shows for one mod, built by ModListHandler.load_mods."""
+
+    name: str
+    # Lowercased once so searching doesn't redo it per keystroke
+    name_lower: str
+    enabled: bool
+    external: bool
+    is_folder_mod: bool
+    advanced_options: dict[str, Any]
+    has_advanced_options: bool
+    update_available_version: str | None
+    type_label: str
+    # File name under resources/icon
+    type_icon: str
+    # Name used when the mod is listed under its parent package
+    nested_name: str | None
+    # _IN_* bits for the filters this mod shows up under
+    filter_mask: int
+
+
+# Category bits set in ModDisplayInfo.filter_mask
+_IN_ALL = 1
+_IN_ENABLED = 2
+_IN_DISABLED = 4
+
+# Bits a mod needs for each filter button, keyed by GamePage.current_filter
+_FILTER_MASKS = {
+    "all": _IN_ALL,
+    "enabled": _IN_ENABLED,
+    "disabled": _IN_DISABLED,
+}
+
+# ModItem actions that nested DLL rows don't get
+_NESTED_DLL_BLOCKED_ACTIONS = frozenset({"delete", "rename", "select"})
+
+# Filter button stylesheets, formatted once; restyling only touches the
+# buttons whose selected state changes
+_FILTER_BUTTON_STYLE = """
+    QPushButton {{
+        background-color: {bg_color}; border: 1px solid {border_color};
+        color: {text_color}; border-radius: 6px; padding: 0px 12px;
+        font-size: 12px; font-weight: 500;
+    }}
+    QPushButton:hover {{
+        background-color: {hover_bg_color}; border-color: {hover_border_color};
+    }}
+"""
+_FILTER_BUTTON_SELECTED_STYLE = _FILTER_BUTTON_STYLE.format(
+    bg_color="#0078d4",
+    border_color="#0078d4",
+    text_color="white",
+    hover_bg_color="#106ebe",
+    hover_border_color="#106ebe",
+)
+_FILTER_BUTTON_DEFAULT_STYLE = _FILTER_BUTTON_STYLE.format(
+    bg_color="#3d3d3d",
+    border_color="#4d4d4d",
+    text_color="#cccccc",
+    hover_bg_color="#4d4d4d",
+    hover_border_color="#5d5d5d",
+)
+
+
+def _type_label_and_icon(mod_info) -> tuple[str, str]:
+    """Return the mod type label and the icon file name shown on its row."""
+    if mod_info.mod_type is ModType.DLL and mod_info.parent_package:
+        return tr("mod_type_nested_dll"), "dll.svg"
+    if mod_info.mod_type is ModType.FOLDER:
+        return tr("mod_type_package"), "folder.svg"
+    return tr("mod_type_native"), "dll.svg"
+
+
+def _nested_display_name(mod_path: str, mod_info) -> str:
+    """Name shown for a mod listed under its parent package."""
+    if mod_info.mod_type is ModType.DLL:
+        return os.path.splitext(os.path.basename(mod_path))[0]
+    if "/" in mod_info.name:
+        return mod_info.name.split("/", 1)[1]
+    return os.path.basename(mod_path)
+
+
 class ModListHandler:
     """Manages the loading, filtering, and display of the mod list itself."""
 
     def __init__(self, game_page: "GamePage"):
         self.game_page = game_page
+        # Filter button currently styled as selected
+        self._selected_filter_button: QPushButton | None = None
+        # Paths of the mods matching each filter, built by load_mods for
+        # the mods dict in _bucketed_mods
+        self._filter_buckets: dict[str, list[str]] = {}
+        self._bucketed_mods: dict[str, ModDisplayInfo] | None = None
+        # Rows taken off the page, kept for reuse if they come back
+        # unchanged; keyed by _widget_key
+        self._widget_pool: OrderedDict[tuple, ModItem] = OrderedDict()
+        # Mod type icons by file name, shared by every row
+        self._icon_cache: dict[str, QIcon] = {}
+        # What the current gp.all_mods_data was built from
+        self._loaded_mod_infos: dict[str, Any] | None = None
+        self._loaded_nexus_signature: tuple[str, int, int] | None = None
+        # Path(mod_path).resolve() results from the last load_mods
+        self._resolved_paths: dict[str, str] = {}
+        # Mods dict gp.filtered_mods was last taken from
+        self._filtered_source: dict[str, ModDisplayInfo] | None = None
+        # Tree grouping of gp.filtered_mods, reused until the filter result changes
+        self._grouped_mods: dict[str, dict[str, Any]] | None = None
 
     def set_filter(self, filter_name: str):
         """Sets the current mod filter and triggers a UI update."""
@@ -34,35 +141,20 @@ class ModListHandler:
 
     def update_filter_button_styles(self):
         """Updates the visual style of the filter buttons to show the active filter."""
-        base_style = """
-            QPushButton {{
-                background-color: {bg_color}; border: 1px solid {border_color};
-                color: {text_color}; border-radius: 6px; padding: 0px 12px;
-                font-size: 12px; font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_bg_color}; border-color: {hover_border_color};
-            }}
-        """
-        selected_style = base_style.format(
-            bg_color="#0078d4",
-            border_color="#0078d4",
-            text_color="white",
-            hover_bg_color="#106ebe",
-            hover_border_color="#106ebe",
-        )
-        default_style = base_style.format(
-            bg_color="#3d3d3d",
-            border_color="#4d4d4d",
-            text_color="#cccccc",
-            hover_bg_color="#4d4d4d",
-            hover_border_color="#5d5d5d",
-        )
-        for name, button in self.game_page.filter_buttons.items():
-            if name == self.game_page.current_filter:
-                button.setStyleSheet(selected_style)
-            else:
-                button.setStyleSheet(default_style)
+        buttons = self.game_page.filter_buttons
+        selected = buttons.get(self.game_page.current_filter)
+        if selected is self._selected_filter_button:
+            return
+        if self._selected_filter_button is None:
+            # First call: every button still needs its default style
+            for button in buttons.values():
+                if button is not selected:
+                    button.setStyleSheet(_FILTER_BUTTON_DEFAULT_STYLE)
+        else:
+            self._selected_filter_button.setStyleSheet(_FILTER_BUTTON_DEFAULT_STYLE)
+        if selected is not None:
+            selected.setStyleSheet(_FILTER_BUTTON_SELECTED_STYLE)
+        self._selected_filter_button = selected
 
     def load_mods(self, reset_page: bool = True):
         """Reloads mods from the ModManager and updates the UI."""
@@ -75,40 +167,94 @@ class ModListHandler:
             return
 
         gp.mod_infos = gp.mod_manager.get_all_mods(gp.game_name)
+        try:
+            nexus_signature = gp.nexus_metadata.file_signature()
+        except Exception:
+            nexus_signature = None
+
+        # Same mods and same Nexus metadata as the last load: the list
+        # entries built then are still current, so only refilter
+        if (
+            self._bucketed_mods is not None
+            and self._bucketed_mods is gp.all_mods_data
+            and gp.mod_infos == self._loaded_mod_infos
+            and nexus_signature == self._loaded_nexus_signature
+        ):
+            self.apply_filters(reset_page=reset_page)
+            # apply_filters skips the redraw when the matches are the same,
+            # so rewrite the summary over any transient status text
+            gp.update_pagination_status()
+            gp.update_profile_dropdown()
+            return
+        self._loaded_mod_infos = gp.mod_infos
+        self._loaded_nexus_signature = nexus_signature
+
+        # Resolving touches the disk, so reuse the results for mods seen before
+        previous = self._resolved_paths
+        self._resolved_paths = {}
+        for mod_path in gp.mod_infos:
+            resolved = previous.get(mod_path)
+            if resolved is None:
+                try:
+                    resolved = str(Path(mod_path).resolve())
+                except OSError:
+                    continue
+            self._resolved_paths[mod_path] = resolved
+        try:
+            linked_mods = gp.nexus_metadata.find_for_local_mods(
+                list(self._resolved_paths.values())
+            )
+        except Exception:
+            linked_mods = {}
+
         final_mods = {}
         for mod_path, mod_info in gp.mod_infos.items():
             display_name = mod_info.name
             update_available_version = None
             # If this mod was downloaded/linked from Nexus, prefer Nexus display name.
-            try:
-                linked = gp.nexus_metadata.find_for_local_mod(
-                    str(Path(mod_path).resolve())
-                )
-                if linked:
-                    if linked.custom_name:
-                        display_name = linked.custom_name
-                    elif linked.mod_name:
-                        display_name = linked.mod_name
-
-                if linked and linked.update_available and linked.update_latest_version:
+            linked = linked_mods.get(self._resolved_paths.get(mod_path))
+            if linked:
+                if linked.custom_name:
+                    display_name = linked.custom_name
+                elif linked.mod_name:
+                    display_name = linked.mod_name
+
+                if linked.update_available and linked.update_latest_version:
                     update_available_version = linked.update_latest_version
-            except Exception:
-                pass
-            final_mods[mod_path] = {
-                "name": display_name,
-                "enabled": mod_info.status == ModStatus.ENABLED,
-                "external": mod_info.is_external,
-                "is_folder_mod": mod_info.mod_type == ModType.FOLDER,
-                "advanced_options": mod_info.advanced_options,
-                "update_available_version": update_available_version,
-            }
+            type_label, type_icon = _type_label_and_icon(mod_info)
+            enabled = mod_info.status is ModStatus.ENABLED
+            final_mods[mod_path] = ModDisplayInfo(
+                name=display_name,
+                name_lower=display_name.lower(),
+                enabled=enabled,
+                external=mod_info.is_external,
+                is_folder_mod=mod_info.mod_type is ModType.FOLDER,
+                advanced_options=mod_info.advanced_options,
+                has_advanced_options=gp.mod_manager.has_advanced_options(mod_info),
+                update_available_version=update_available_version,
+                type_label=type_label,
+                type_icon=type_icon,
+                nested_name=(
+                    _nested_display_name(mod_path, mod_info)
+                    if mod_info.parent_package
+                    else None
+                ),
+                filter_mask=_IN_ALL | (_IN_ENABLED if enabled else _IN_DISABLED),
+            )
 
         gp.all_mods_data = final_mods
+        self._filter_buckets = {
+            name: [path for path, info in final_mods.items() if info.filter_mask & mask]
+            for name, mask in _FILTER_MASKS.items()
+        }
+        self._bucketed_mods = final_mods
         self.apply_filters(reset_page=reset_page, source_mods=final_mods)
         gp.update_profile_dropdown()
 
     def apply_filters(
-        self, reset_page: bool = True, source_mods: dict[str, Any] | None = None
+        self,
+        reset_page: bool = True,
+        source_mods: dict[str, ModDisplayInfo] | None = None,
     ):
         """Filters the mod list based on search text and category."""
         gp = self.game_page
@@ -119,59 +265,67 @@ class ModListHandler:
         else:
             search_text = ""
         all_mods = source_mods if source_mods is not None else gp.all_mods_data
-        gp.filtered_mods = {}
-
-        for mod_path, info in all_mods.items():
-            if search_text not in info["name"].lower():
-                continue
 
-            is_enabled = info["enabled"]
-
-            category_match = False
-            if gp.current_filter == "all":
-                category_match = True
-            elif gp.current_filter == "enabled":
-                category_match = is_enabled
-            elif gp.current_filter == "disabled":
-                category_match = not is_enabled
+        if all_mods is self._bucketed_mods:
+            candidates = self._filter_buckets.get(gp.current_filter, [])
+        else:
+            # Unknown filters match nothing
+            mask = _FILTER_MASKS.get(gp.current_filter, 0)
+            candidates = [
+                path for path, info in all_mods.items() if info.filter_mask & mask
+            ]
+
+        if search_text:
+            matches = [
+                path for path in candidates if search_text in all_mods[path].name_lower
+            ]
+        else:
+            matches = candidates
 
-            if category_match:
-                gp.filtered_mods[mod_path] = info
+        # Nothing to redraw when the same mods match again (e.g. a keystroke
+        # that doesn't narrow the results), so the current widgets stay up
+        if (
+            all_mods is self._filtered_source
+            and (not reset_page or gp.current_page == 1)
+            and list(gp.filtered_mods) == matches
+        ):
+            return
+        gp.filtered_mods = {path: all_mods[path] for path in matches}
+        self._filtered_source = all_mods
+        self._grouped_mods = None
 
         if reset_page:
             gp.current_page = 1
         gp.update_pagination()
 
+    def grouped_filtered_mods(self) -> dict[str, dict[str, Any]]:
+        """Tree grouping of gp.filtered_mods, built once per filter result.
+
+        Page changes only slice the result, so they don't regroup.
+        """
+        if self._grouped_mods is None:
+            self._grouped_mods = self._group_mods_for_tree_display(
+                list(self.game_page.filtered_mods.items())
+            )
+        return self._grouped_mods
+
     def _group_mods_for_tree_display(self, mod_items):
         """Groups mods to create expandable tree structure."""
         gp = self.game_page
-        if not hasattr(gp, "expanded_states"):
-            gp.expanded_states = {}
 
         grouped = {}
-        parent_packages, nested_mods = {}, {}
+        parent_packages = {}
+        nested_mods: defaultdict[str, list] = defaultdict(list)
 
         for mod_path, info in mod_items:
-            if mod_path in gp.mod_infos:
-                mod_info = gp.mod_infos[mod_path]
-
+            mod_info = gp.mod_infos.get(mod_path)
+            if mod_info is not None:
                 if mod_info.parent_package:
-                    parent_name = mod_info.parent_package
-                    if parent_name not in nested_mods:
-                        nested_mods[parent_name] = []
-                    clean_info = info.copy()
-
-                    if mod_info.mod_type == ModType.DLL:
-                        clean_info["name"] = Path(mod_path).stem
-                    else:
-                        clean_info["name"] = (
-                            mod_info.name.split("/", 1)[1]
-                            if "/" in mod_info.name
-                            else Path(mod_path).name
-                        )
-
-                    nested_mods[parent_name].append((mod_path, clean_info, info))
-                elif mod_info.mod_type == ModType.FOLDER:
+                    # The renamed row copy is only made if it ends up in a tree
+                    nested_mods[mod_info.parent_package].append(
+                        (mod_path, mod_info, info)
+                    )
+                elif mod_info.mod_type is ModType.FOLDER:
                     parent_packages[mod_info.name] = (mod_path, info)
                 else:
                     grouped[mod_path] = {"type": "standalone", "info": info}
@@ -197,8 +351,8 @@ class ModListHandler:
                         "type": "parent_with_children",
                         "parent": parent_info,
                         "children": {
-                            child_path: child_info
-                            for child_path, child_info, _ in children_list
+                            child_path: replace(child_info, name=child_info.nested_name)
+                            for child_path, _, child_info in children_list
                         },
                         "expanded": gp.expanded_states.get(parent_path, False),
                     }
@@ -212,6 +366,15 @@ class ModListHandler:
                 grouped[parent_path] = {"type": "standalone", "info": parent_info}
         return grouped
 
+    def _type_icon(self, file_name: str) -> QIcon:
+        """Return the icon at resources/icon/<file_name>, loading it once."""
+        icon = self._icon_cache.get(file_name)
+        if icon is None:
+            icon = self._icon_cache[file_name] = QIcon(
+                resource_path(f"resources/icon/{file_name}")
+            )
+        return icon
+
     def _create_mod_widget(
         self,
         mod_path,
@@ -223,10 +386,20 @@ class ModListHandler:
     ):
         """Factory method to create a single ModItem widget."""
         gp = self.game_page
-        is_enabled, is_folder_mod = (
-            info["enabled"],
-            info.get("is_folder_mod", False),
-        )
+        key = (mod_path, id(info), is_nested, has_children, is_last_child)
+        mod_widget = self._widget_pool.pop(key, None)
+        if (
+            mod_widget is not None
+            and mod_widget._pool_info is info
+            and mod_widget.is_enabled == info.enabled
+        ):
+            mod_widget.set_expanded(is_expanded)
+            mod_widget.show()
+            return mod_widget
+        if mod_widget is not None:
+            mod_widget.deleteLater()
+
+        is_enabled = info.enabled
 
         text_color = "#cccccc" if not is_enabled else "#90EE90"
         if is_nested:
@@ -234,69 +407,92 @@ class ModListHandler:
 
         mod_info = gp.mod_infos.get(mod_path)
 
-        if mod_info and mod_info.mod_type == ModType.DLL and mod_info.parent_package:
-            mod_type, type_icon = (
-                tr("mod_type_nested_dll"),
-                QIcon(resource_path("resources/icon/dll.svg")),
-            )
-        elif is_folder_mod:
-            mod_type, type_icon = (
-                tr("mod_type_package"),
-                QIcon(resource_path("resources/icon/folder.svg")),
-            )
-        else:
-            mod_type, type_icon = (
-                tr("mod_type_native"),
-                QIcon(resource_path("resources/icon/dll.svg")),
-            )
-
-        has_advanced_options = (
-            gp.mod_manager.has_advanced_options(mod_info) if mod_info else False
-        )
-
         mod_widget = ModItem(
             mod_path=mod_path,
-            mod_name=info["name"],
+            mod_name=info.name,
             is_enabled=is_enabled,
-            is_external=info["external"],
-            is_folder_mod=is_folder_mod,
-            mod_type=mod_type,
-            type_icon=type_icon,
+            is_external=info.external,
+            is_folder_mod=info.is_folder_mod,
+            mod_type=info.type_label,
+            type_icon=self._type_icon(info.type_icon),
             item_bg_color="transparent",
             text_color=text_color,
-            has_advanced_options=has_advanced_options,
+            has_advanced_options=info.has_advanced_options,
             is_nested=is_nested,
             has_children=has_children,
             is_expanded=is_expanded,
             is_container=mod_info.is_container if mod_info else False,
-            update_available_version=info.get("update_available_version"),
+            update_available_version=info.update_available_version,
             is_last_child=is_last_child,
         )
 
-        # Connect signals to the GamePage's delegating methods
-        mod_widget.toggled.connect(gp.toggle_mod)
-
+        # One connection per row; the handler routes each action to the
+        # GamePage's delegating methods.
         # Nested FOLDERS (subfolders with mod content) should have full functionality
         # Only nested DLLs should be restricted
-        is_nested_dll = is_nested and mod_info and mod_info.mod_type == ModType.DLL
+        is_nested_dll = is_nested and mod_info and mod_info.mod_type is ModType.DLL
+        if is_nested_dll:
+            mod_widget.action_requested.connect(self._dispatch_nested_dll_action)
+        else:
+            mod_widget.action_requested.connect(self._dispatch_mod_action)
 
-        if not is_nested_dll:
-            mod_widget.delete_requested.connect(gp.delete_mod)
-            mod_widget.rename_requested.connect(gp.rename_mod)
-            mod_widget.clicked.connect(gp.on_local_mod_selected)
+        # Holding info also keeps its id() from being reused while pooled
+        mod_widget._pool_key = key
+        mod_widget._pool_info = info
+        return mod_widget
 
-        mod_widget.edit_config_requested.connect(gp.open_config_editor)
-        mod_widget.open_folder_requested.connect(gp.open_mod_folder)
-        mod_widget.advanced_options_requested.connect(gp.open_advanced_options)
+    def release_mod_widget(self, widget) -> None:
+        """Take a row off the page, keeping it for reuse by _create_mod_widget.
 
-        return mod_widget
+        The pool holds up to two pages of rows; older ones are deleted.
+        """
+        key = getattr(widget, "_pool_key", None)
+        if key is None:
+            widget.deleteLater()
+            return
+        widget.hide()
+        stale = self._widget_pool.pop(key, None)
+        if stale is not None and stale is not widget:
+            stale.deleteLater()
+        self._widget_pool[key] = widget
+        limit = max(1, self.game_page.mods_per_page * 2)
+        while len(self._widget_pool) > limit:
+            _key, oldest = self._widget_pool.popitem(last=False)
+            oldest.deleteLater()
+
+    def _dispatch_mod_action(self, mod_path: str, action: str, payload):
+        """Route a ModItem action_requested emission to the GamePage."""
+        gp = self.game_page
+        if action == "toggle":
+            gp.toggle_mod(mod_path, payload)
+        elif action == "expand":
+            gp._on_mod_expand_requested(mod_path, payload)
+        elif action == "delete":
+            gp.delete_mod(mod_path)
+        elif action == "rename":
+            gp.rename_mod(mod_path)
+        elif action == "select":
+            gp.on_local_mod_selected(mod_path)
+        elif action == "edit_config":
+            gp.open_config_editor(mod_path)
+        elif action == "open_folder":
+            gp.open_mod_folder(mod_path)
+        elif action == "advanced_options":
+            gp.open_advanced_options(mod_path)
+
+    def _dispatch_nested_dll_action(self, mod_path: str, action: str, payload):
+        """_dispatch_mod_action for nested DLL rows, which can't be deleted,
+        renamed or selected on their own."""
+        if action not in _NESTED_DLL_BLOCKED_ACTIONS:
+            self._dispatch_mod_action(mod_path, action, payload)
 
     def _on_mod_expand_requested(self, mod_path: str, expanded: bool):
         """Handles expand/collapse requests for parent mods."""
         gp = self.game_page
-        if not hasattr(gp, "expanded_states"):
-            gp.expanded_states = {}
         gp.expanded_states[mod_path] = expanded
+        group = (self._grouped_mods or {}).get(mod_path)
+        if group and group["type"] == "parent_with_children":
+            group["expanded"] = expanded
         gp.update_pagination()
 
         # Scroll to the expanded/collapsed item to keep context
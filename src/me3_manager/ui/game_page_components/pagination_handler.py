@@ -45,10 +45,8 @@ class PaginationHandler:
         This is the core method for redrawing the mod widgets.
         """
         gp = self.game_page  # Create a shorter alias for readability
-        # Group mods for tree display (calls back to a method on GamePage)
-        grouped_mods_all = gp._group_mods_for_tree_display(
-            list(gp.filtered_mods.items())
-        )
+        # Group mods for tree display (cached until the filters are reapplied)
+        grouped_mods_all = gp.mod_list_handler.grouped_filtered_mods()
 
         # Calculate pages based on visible ROOT groups (collapsed children don't count)
         group_keys = list(grouped_mods_all.keys())
@@ -68,11 +66,11 @@ class PaginationHandler:
         gp.prev_btn.setEnabled(gp.current_page > 1)
         gp.next_btn.setEnabled(gp.current_page < gp.total_pages)
 
-        # Clear existing widgets from the layout
+        # Clear existing widgets from the layout; rows go back to the pool
         while gp.mods_layout.count():
             child = gp.mods_layout.takeAt(0)
             if child.widget():
-                child.widget().deleteLater()
+                gp.mod_list_handler.release_mod_widget(child.widget())
 
         # Initialize map to track widgets for scrolling
         gp.mod_widgets_map = {}
@@ -96,7 +94,6 @@ class PaginationHandler:
                     has_children=True,
                     is_expanded=group_data.get("expanded", False),
                 )
-                parent_widget.expand_requested.connect(gp._on_mod_expand_requested)
                 gp.mods_layout.addWidget(parent_widget)
                 gp.mod_widgets_map[group_key] = parent_widget
 
@@ -124,10 +121,16 @@ class PaginationHandler:
         # Add stretch to push items to the top
         gp.mods_layout.addStretch()
 
-        # Update status label
+        self.update_status_label()
+
+    def update_status_label(self):
+        """Shows which mods of the filtered list the current page covers."""
+        gp = self.game_page
+        start_idx = (gp.current_page - 1) * gp.mods_per_page
+        end_idx = start_idx + gp.mods_per_page
         total_mods_filtered = len(gp.filtered_mods)
         enabled_mods_filtered = sum(
-            1 for info in gp.filtered_mods.values() if info["enabled"]
+            1 for info in gp.filtered_mods.values() if info.enabled
         )
         showing_start = start_idx + 1 if total_mods_filtered > 0 else 0
         showing_end = min(end_idx, total_mods_filtered)
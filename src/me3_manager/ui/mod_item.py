@@ -102,6 +102,21 @@ class ModItem(QWidget):
     advanced_options_requested = Signal(str)
     expand_requested = Signal(str, bool)  # New signal for expand/collapse
     clicked = Signal(str)  # Emitted when the row is clicked (for sidebar/details)
+    # Every request above as (mod_path, action, payload), so a list can
+    # handle a row with a single connection
+    action_requested = Signal(str, str, object)
+
+    # Per-action signal emitted alongside action_requested
+    _ACTION_SIGNALS = {
+        "toggle": "toggled",
+        "delete": "delete_requested",
+        "rename": "rename_requested",
+        "open_folder": "open_folder_requested",
+        "edit_config": "edit_config_requested",
+        "advanced_options": "advanced_options_requested",
+        "expand": "expand_requested",
+        "select": "clicked",
+    }
 
     def __init__(
         self,
@@ -362,9 +377,7 @@ class ModItem(QWidget):
             config_btn.setFixedSize(button_size, button_size)
             config_btn.setToolTip(tr("edit_config_tooltip_ini"))
             config_btn.setStyleSheet(self._get_action_button_style())
-            config_btn.clicked.connect(
-                lambda: self.edit_config_requested.emit(self.mod_path)
-            )
+            config_btn.clicked.connect(lambda: self._request("edit_config"))
             layout.addWidget(config_btn)
 
         # Open folder button for external mods
@@ -373,9 +386,7 @@ class ModItem(QWidget):
             open_btn.setIcon(QIcon(resource_path("resources/icon/folder.svg")))
             open_btn.setToolTip(tr("open_containing_folder_tooltip"))
             open_btn.setStyleSheet(self._get_action_button_style())
-            open_btn.clicked.connect(
-                lambda: self.open_folder_requested.emit(self.mod_path)
-            )
+            open_btn.clicked.connect(lambda: self._request("open_folder"))
             layout.addWidget(open_btn)
 
         # Advanced options button (skip for parent containers)
@@ -391,9 +402,7 @@ class ModItem(QWidget):
             else:
                 advanced_btn.setStyleSheet(self._get_action_button_style())
 
-            advanced_btn.clicked.connect(
-                lambda: self.advanced_options_requested.emit(self.mod_path)
-            )
+            advanced_btn.clicked.connect(lambda: self._request("advanced_options"))
             layout.addWidget(advanced_btn)
 
         # Delete button (skip only for nested mods)
@@ -403,9 +412,7 @@ class ModItem(QWidget):
             delete_btn.setFixedSize(button_size, button_size)
             delete_btn.setToolTip(tr("delete_mod_tooltip"))
             delete_btn.setStyleSheet(self._get_delete_button_style())
-            delete_btn.clicked.connect(
-                lambda: self.delete_requested.emit(self.mod_path)
-            )
+            delete_btn.clicked.connect(lambda: self._request("delete"))
             layout.addWidget(delete_btn)
 
     def _get_base_button_style(
@@ -459,6 +466,15 @@ class ModItem(QWidget):
         """Style for delete button"""
         return self._get_base_button_style("#4a4a4a", "#dc3545", "#c82333")
 
+    def _request(self, action: str, payload=None):
+        """Emit the signal for action and action_requested."""
+        signal = getattr(self, self._ACTION_SIGNALS[action])
+        if payload is None:
+            signal.emit(self.mod_path)
+        else:
+            signal.emit(self.mod_path, payload)
+        self.action_requested.emit(self.mod_path, action, payload)
+
     def _update_expand_button(self):
         """Update expand button icon based on state"""
         if hasattr(self, "expand_btn"):
@@ -468,7 +484,7 @@ class ModItem(QWidget):
         """Handle expand/collapse button click"""
         self.is_expanded = not self.is_expanded
         self._update_expand_button()
-        self.expand_requested.emit(self.mod_path, self.is_expanded)
+        self._request("expand", self.is_expanded)
 
     def _setup_tooltip(self):
         """Setup tooltip based on mod type"""
@@ -529,13 +545,13 @@ class ModItem(QWidget):
         """Handle toggle button click"""
         self.is_enabled = not self.is_enabled
         self.update_toggle_button_ui()
-        self.toggled.emit(self.mod_path, self.is_enabled)
+        self._request("toggle", self.is_enabled)
 
     def mousePressEvent(self, event):
         """Emit a click signal for selection (sidebar/details)."""
         try:
             if event.button() == Qt.MouseButton.LeftButton:
-                self.clicked.emit(self.mod_path)
+                self._request("select")
         except Exception:
             pass
         super().mousePressEvent(event)
@@ -580,9 +596,7 @@ class ModItem(QWidget):
         """)
 
         rename_action = QAction(tr("rename_mod_context_menu", default="Rename"), self)
-        rename_action.triggered.connect(
-            lambda: self.rename_requested.emit(self.mod_path)
-        )
+        rename_action.triggered.connect(lambda: self._request("rename"))
         menu.addAction(rename_action)
 
         menu.exec_(event.globalPos())
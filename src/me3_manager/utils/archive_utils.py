@@ -9,14 +9,20 @@ falling back to patoolib for robustness.
 from __future__ import annotations
 
 import logging
+import os
 import platform
 import shutil
 import subprocess
+import sys
+import threading
 import time
 import zipfile
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from me3_manager.utils.constants import JUNK_NAMES
+
 try:
     import winreg
 except ImportError:
@@ -34,6 +40,15 @@ def is_archive(path: Path) -> bool:
     return path.is_file() and path.suffix.lower() in ARCHIVE_EXTENSIONS
 
 
+# Chunk size for streaming ZIP members to disk
+_ZIP_COPY_BUFSIZE = 1024 * 1024
+
+# Threads decompressing ZIP members in parallel
+_ZIP_WORKERS = min(8, os.cpu_count() or 1)
+
+# Characters ZipFile.extract replaces in member names on Windows
+_WINDOWS_ILLEGAL = str.maketrans(dict.fromkeys(':<>|"?*', "_"))
+
 # Cached path to 7-Zip executable
 _7ZIP_PATH: str | None = None
 
@@ -136,15 +151,103 @@ def extract_archive(
     return _extract_with_patool(archive, dest_dir, cancel_check)
 
 
+def _zip_member_parts(filename: str) -> list[str]:
+    """
+    Split a ZIP member name into safe path components, as ZipFile.extract does.
+
+    Drive letters and empty, "." and ".." components are dropped, so the
+    result always stays inside the destination directory.
+    """
+    arcname = filename.replace("/", os.sep)
+    if os.altsep:
+        arcname = arcname.replace(os.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [p for p in arcname.split(os.sep) if p not in ("", os.curdir, os.pardir)]
+    if sys.platform == "win32":
+        parts = [p.translate(_WINDOWS_ILLEGAL).rstrip(".") for p in parts]
+        parts = [p for p in parts if p]
+    return parts
+
+
+def _extract_zip_members(
+    archive: Path,
+    jobs: list[tuple[zipfile.ZipInfo, str]],
+    should_stop: Callable[[], bool],
+) -> None:
+    """Stream the given members of archive to their target paths."""
+    with zipfile.ZipFile(archive, "r") as z:
+        for member, target in jobs:
+            if should_stop():
+                raise InterruptedError("Extraction cancelled")
+            with z.open(member) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, _ZIP_COPY_BUFSIZE)
+
+
 def _extract_zip(
     archive: Path, dest_dir: Path, cancel_check: Callable[[], bool] | None = None
 ) -> bool:
-    """Extract a ZIP archive using Python's built-in zipfile module."""
+    """
+    Extract a ZIP archive using Python's built-in zipfile module.
+
+    Members are streamed to disk in 1 MiB chunks and junk entries
+    (__MACOSX, .DS_Store) are never written. zlib releases the GIL while
+    inflating, so members are spread over a few threads, each with its own
+    ZipFile handle, to decompress on several cores at once.
+    """
+    dest_root = os.fspath(dest_dir)
     with zipfile.ZipFile(archive, "r") as z:
-        for member in z.infolist():
-            if cancel_check and cancel_check():
-                raise InterruptedError("Extraction cancelled")
-            z.extract(member, dest_dir)
+        members = z.infolist()
+
+    # Keyed by the normalized target: when several members land on the same
+    # file only the last one is kept, as with extractall, instead of two
+    # threads writing it at once
+    targets: dict[str, tuple[zipfile.ZipInfo, str]] = {}
+    dirs: set[str] = set()
+    for member in members:
+        parts = _zip_member_parts(member.filename)
+        if not parts or not JUNK_NAMES.isdisjoint(parts):
+            continue
+        target = os.path.join(dest_root, *parts)
+        if member.is_dir():
+            dirs.add(target)
+        else:
+            dirs.add(os.path.dirname(target))
+            targets[os.path.normcase(target)] = (member, target)
+    jobs = list(targets.values())
+
+    # Create every directory up front so the workers never race on them
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+
+    failed = threading.Event()
+
+    def should_stop() -> bool:
+        return failed.is_set() or bool(cancel_check and cancel_check())
+
+    workers = min(_ZIP_WORKERS, len(jobs))
+    if workers <= 1:
+        _extract_zip_members(archive, jobs, should_stop)
+        return True
+
+    # Deal the largest members out first so the threads finish together
+    jobs.sort(key=lambda job: job[0].compress_size, reverse=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_extract_zip_members, archive, jobs[i::workers], should_stop)
+            for i in range(workers)
+        ]
+        errors = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed.set()
+                errors.append(e)
+    if errors:
+        # Prefer the real failure over the InterruptedErrors it caused
+        raise next(
+            (e for e in errors if not isinstance(e, InterruptedError)), errors[0]
+        )
     return True
 
 
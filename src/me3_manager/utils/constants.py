@@ -24,3 +24,6 @@ ACCEPTABLE_FOLDERS = [
     "shader",
     "sound",
 ]
+
+# Common junk files/folders (archive tool metadata) to filter out
+JUNK_NAMES = frozenset({"__MACOSX", ".DS_Store"})
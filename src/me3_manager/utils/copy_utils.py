@@ -0,0 +1,186 @@
+"""
+File copy utilities.
+
+Provides drop-in replacements for shutil copy functions that keep file data
+inside the kernel: cloning on copy-on-write filesystems (btrfs, XFS,
+bcachefs, APFS) and copy_file_range where available, falling back to
+shutil's own fast paths (sendfile, CopyFile2) everywhere else, plus a
+durable variant of os.replace for swapping installed files into place.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import sys
+
+log = logging.getLogger(__name__)
+
+# FICLONE ioctl request number from <linux/fs.h>
+_FICLONE = 0x40049409
+
+# errno values meaning "reflink not possible here", as opposed to a real I/O error
+_REFLINK_UNSUPPORTED = frozenset(
+    {
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOTTY,
+        errno.EBADF,
+        errno.ENOSYS,
+        errno.EEXIST,
+    }
+)
+
+# errno values meaning "copy_file_range can't handle this pair of files"
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    {
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.EBADF,
+        errno.EPERM,
+    }
+)
+
+_CAN_REFLINK = sys.platform.startswith("linux") or sys.platform == "darwin"
+_CAN_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+# Minimum number of bytes requested per copy_file_range call
+_COPY_RANGE_BLOCK = 8 * 1024 * 1024
+
+# clonefile(2) flag: don't follow a symlink at src
+_CLONE_NOFOLLOW = 0x0001
+
+# MoveFileExW flags from <winbase.h>
+_MOVEFILE_REPLACE_EXISTING = 0x1
+_MOVEFILE_WRITE_THROUGH = 0x8
+
+
+def _reflink(src: str | os.PathLike, dst: str | os.PathLike) -> None:
+    """Clone src into dst without copying data. Raises OSError if unsupported."""
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), _CLONE_NOFOLLOW):
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), os.fspath(src))
+        return
+
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+def _copy_file_range(fsrc, fdst) -> None:
+    """Copy all of fsrc into fdst with copy_file_range. Raises OSError if unsupported."""
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    blocksize = max(os.fstat(infd).st_size, _COPY_RANGE_BLOCK)
+    while os.copy_file_range(infd, outfd, blocksize):
+        pass
+
+
+def fast_copyfile(src, dst):
+    """
+    Copy file data (no metadata) from src to dst without a userspace buffer.
+
+    Tries, in order: a reflink clone (FICLONE on Linux, clonefile on macOS),
+    copy_file_range (which also offloads to the server on NFS/SMB), and
+    finally shutil.copyfile, which already uses sendfile or a readinto loop.
+    """
+    if _CAN_REFLINK:
+        try:
+            _reflink(src, dst)
+            return dst
+        except OSError as e:
+            if e.errno not in _REFLINK_UNSUPPORTED:
+                raise
+            log.debug("Reflink not supported for %s (%s), copying", src, e)
+
+    if _CAN_COPY_FILE_RANGE:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                _copy_file_range(fsrc, fdst)
+            return dst
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+            log.debug("copy_file_range not supported for %s (%s), copying", src, e)
+
+    return shutil.copyfile(src, dst)
+
+
+def fast_copy(src, dst, *, follow_symlinks: bool = True):
+    """
+    Copy a file and its metadata using fast_copyfile.
+
+    Has the same signature and return value as shutil.copy2, so it can be used
+    as the copy_function of shutil.copytree. On Windows, shutil.copy2 already
+    goes through CopyFile2 and is used as is.
+    """
+    if sys.platform == "win32" or (not follow_symlinks and os.path.islink(src)):
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    fast_copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def link_or_copy(src, dst, *, follow_symlinks: bool = True):
+    """
+    Hard-link src to dst, falling back to fast_copy.
+
+    Only for sources that are throwaway copies: the link shares data with
+    src, so later writes to either file show up in both. Same signature as
+    shutil.copy2.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if follow_symlinks or not os.path.islink(src):
+        try:
+            os.link(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except (OSError, NotImplementedError) as e:
+            log.debug("Hard link not possible for %s (%s), copying", src, e)
+    return fast_copy(src, dst, follow_symlinks=follow_symlinks)
+
+
+def durable_replace(src: str | os.PathLike, dst: str | os.PathLike) -> None:
+    """
+    os.replace that doesn't return until the rename itself is on disk.
+
+    On POSIX the parent directory of dst is fsynced after the rename; on
+    Windows MoveFileExW is called with MOVEFILE_WRITE_THROUGH. Raises OSError
+    like os.replace.
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        flags = _MOVEFILE_REPLACE_EXISTING | _MOVEFILE_WRITE_THROUGH
+        if not ctypes.windll.kernel32.MoveFileExW(
+            os.fspath(src), os.fspath(dst), flags
+        ):
+            raise ctypes.WinError()
+        return
+
+    os.replace(src, dst)
+    try:
+        dir_fd = os.open(os.path.dirname(os.path.abspath(dst)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError as e:
+        # Some filesystems can't fsync directories; the rename still happened
+        log.debug("Could not fsync directory of %s (%s)", dst, e)
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,65 @@
+import zipfile
+
+import pytest
+
+from me3_manager.utils.archive_utils import extract_archive
+
+
+def test_extract_zip_streams_members_and_skips_junk(tmp_path):
+    archive = tmp_path / "mod.zip"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("MyMod/", "")
+        z.writestr("MyMod/regulation.bin", b"\x01" * (3 * 1024 * 1024 + 7))
+        z.writestr("MyMod/parts/a.dcx", b"parts")
+        z.writestr("__MACOSX/MyMod/._regulation.bin", b"junk")
+        z.writestr("MyMod/.DS_Store", b"junk")
+        z.writestr("../escape.txt", b"nope")
+
+    dest = tmp_path / "out"
+    dest.mkdir()
+    assert extract_archive(archive, dest)
+
+    files = sorted(p.relative_to(dest).as_posix() for p in dest.rglob("*"))
+    assert files == [
+        "MyMod",
+        "MyMod/parts",
+        "MyMod/parts/a.dcx",
+        "MyMod/regulation.bin",
+        "escape.txt",
+    ]
+    assert (dest / "MyMod" / "regulation.bin").stat().st_size == 3 * 1024 * 1024 + 7
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_extract_zip_in_parallel_and_cancel(tmp_path):
+    archive = tmp_path / "pack.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as z:
+        for i in range(40):
+            z.writestr(f"Pack/part{i % 4}/file{i}.txt", f"payload {i}" * 1000)
+
+    dest = tmp_path / "out"
+    dest.mkdir()
+    assert extract_archive(archive, dest)
+    for i in range(40):
+        path = dest / "Pack" / f"part{i % 4}" / f"file{i}.txt"
+        assert path.read_text() == f"payload {i}" * 1000
+
+    cancelled = tmp_path / "cancelled"
+    cancelled.mkdir()
+    with pytest.raises(InterruptedError):
+        extract_archive(archive, cancelled, cancel_check=lambda: True)
+    assert not any(p.is_file() for p in cancelled.rglob("*"))
+
+
+def test_extract_zip_keeps_last_of_duplicate_members(tmp_path):
+    archive = tmp_path / "dupes.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as z:
+        for i in range(8):
+            z.writestr(f"Pack/file{i}.txt", b"x" * 100_000)
+        with pytest.warns(UserWarning, match="Duplicate name"):
+            z.writestr("Pack/file0.txt", b"final")
+
+    dest = tmp_path / "out"
+    dest.mkdir()
+    assert extract_archive(archive, dest)
+    assert (dest / "Pack" / "file0.txt").read_bytes() == b"final"
@@ -0,0 +1,96 @@
+import os
+
+from me3_manager.utils.copy_utils import (
+    durable_replace,
+    fast_copy,
+    link_or_copy,
+)
+
+
+def test_fast_copy_copies_contents(tmp_path):
+    src = tmp_path / "mod.dll"
+    src.write_bytes(b"\x00binary\xff" * 100)
+    dst = tmp_path / "copy.dll"
+
+    assert fast_copy(src, dst) == dst
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_fast_copy_into_directory(tmp_path):
+    src = tmp_path / "config.ini"
+    src.write_text("[section]\nkey=value\n")
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+
+    fast_copy(src, dest_dir)
+
+    assert (dest_dir / "config.ini").read_text() == src.read_text()
+
+
+def test_fast_copy_preserves_contents_and_mtime(tmp_path):
+    src = tmp_path / "asset.bin"
+    src.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    os.utime(src, (1_000_000, 1_000_000))
+    dst = tmp_path / "asset_copy.bin"
+
+    assert fast_copy(src, dst) == dst
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == 1_000_000
+
+
+def test_fast_copy_empty_file(tmp_path):
+    src = tmp_path / "empty.txt"
+    src.touch()
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+
+    fast_copy(src, dest_dir)
+
+    assert (dest_dir / "empty.txt").read_bytes() == b""
+
+
+def test_fast_copy_keeps_symlink_when_not_following(tmp_path):
+    target = tmp_path / "real.txt"
+    target.write_text("data")
+    link = tmp_path / "link.txt"
+    link.symlink_to(target)
+    dst = tmp_path / "copied_link.txt"
+
+    fast_copy(link, dst, follow_symlinks=False)
+
+    assert dst.is_symlink()
+
+
+def test_link_or_copy_links_on_same_filesystem(tmp_path):
+    src = tmp_path / "staged.bin"
+    src.write_bytes(b"payload")
+    dst = tmp_path / "installed.bin"
+
+    link_or_copy(src, dst)
+
+    assert dst.read_bytes() == b"payload"
+    assert os.path.samefile(src, dst)
+
+
+def test_link_or_copy_falls_back_to_copy(tmp_path):
+    src = tmp_path / "staged.bin"
+    src.write_bytes(b"new")
+    dst = tmp_path / "installed.bin"
+    dst.write_bytes(b"old")
+
+    link_or_copy(src, dst)
+
+    assert dst.read_bytes() == b"new"
+    assert not os.path.samefile(src, dst)
+
+
+def test_durable_replace_overwrites_file(tmp_path):
+    src = tmp_path / "new.ini"
+    src.write_text("new")
+    dst = tmp_path / "mod.ini"
+    dst.write_text("old")
+
+    durable_replace(src, dst)
+
+    assert not src.exists()
+    assert dst.read_text() == "new"
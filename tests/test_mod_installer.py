@@ -0,0 +1,632 @@
+import os
+import shutil
+import socket
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtCore import QThreadPool
+
+from me3_manager.ui.game_page_components import mod_installer
+from me3_manager.ui.game_page_components.mod_installer import (
+    InstallWorker,
+    ModInstaller,
+    _claim_run_dir,
+    _count_files,
+    _discard_tree,
+    _iter_dlls,
+    _load_hook_module,
+    _plan_copy,
+    _release_run_dir,
+    _sweep_leftovers,
+    _validate_mod_name,
+)
+from me3_manager.utils.translator import translator
+
+
+def _installer() -> ModInstaller:
+    return ModInstaller(MagicMock())
+
+
+def test_discard_tree_frees_path_and_deletes_in_background(qtbot, tmp_path):
+    mod_dir = tmp_path / "mods" / "SomeMod"
+    (mod_dir / "sub").mkdir(parents=True)
+    (mod_dir / "sub" / "file.txt").write_text("data")
+    trash_root = tmp_path / ".trash"
+
+    _discard_tree(mod_dir, trash_root)
+
+    assert not mod_dir.exists()
+    QThreadPool.globalInstance().waitForDone()
+    assert list(trash_root.iterdir()) == []
+
+
+def test_sweep_leftovers_removes_only_unowned_run_folders(qtbot, tmp_path):
+    mods_dir = tmp_path / "mods"
+    (mods_dir / ".partial-abc" / "SomeMod").mkdir(parents=True)
+    scratch_root = tmp_path / ".me3_install_scratch"
+    live_dir, live_lock = _claim_run_dir(scratch_root)
+    (live_dir / "staged").mkdir()
+    # A run whose owner died: its lock names a process that isn't running
+    (scratch_root / "dead" / "sub").mkdir(parents=True)
+    (scratch_root / "dead.lock").write_text(
+        f"999999999\npython\n{socket.gethostname()}\n"
+    )
+    (scratch_root / "orphan").mkdir()
+
+    _sweep_leftovers(scratch_root)
+    QThreadPool.globalInstance().waitForDone()
+
+    assert sorted(p.name for p in scratch_root.iterdir()) == [
+        live_dir.name,
+        f"{live_dir.name}.lock",
+    ]
+    assert (live_dir / "staged").is_dir()
+    assert (mods_dir / ".partial-abc" / "SomeMod").is_dir()
+
+    _release_run_dir(live_dir, live_lock)
+    QThreadPool.globalInstance().waitForDone()
+    assert list(scratch_root.iterdir()) == []
+
+
+def test_count_files_finds_nested_links(tmp_path):
+    mod_dir = tmp_path / "SomeMod"
+    (mod_dir / "a" / "b").mkdir(parents=True)
+    (mod_dir / "a" / "b" / "file.txt").write_text("data")
+    (mod_dir / ".DS_Store").write_text("")
+    assert _count_files(mod_dir) == (1, True, False)
+
+    (mod_dir / "a" / "b" / "link").symlink_to(tmp_path)
+    assert _count_files(mod_dir)[2]
+
+
+def test_iter_dlls_finds_nested_dlls_case_insensitively(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.dll").write_bytes(b"")
+    (tmp_path / "a" / "b" / "Nested.DLL").write_bytes(b"")
+    (tmp_path / "a" / "readme.txt").write_text("")
+    (tmp_path / "folder.dll").mkdir()
+
+    found = sorted(
+        Path(p).relative_to(tmp_path).as_posix() for p in _iter_dlls(tmp_path)
+    )
+    assert found == ["a/b/Nested.DLL", "top.dll"]
+
+
+def test_detect_mod_type_scans_tree_once(tmp_path):
+    installer = _installer()
+
+    native = tmp_path / "native"
+    (native / "SeamlessCoop").mkdir(parents=True)
+    (native / "SeamlessCoop" / "nrsc.DLL").write_bytes(b"")
+    assert installer._detect_mod_type(native) == "native"
+
+    profile = tmp_path / "profile"
+    (profile / "deep").mkdir(parents=True)
+    (profile / "deep" / "mod.me3").write_text("")
+    (profile / "regulation.bin").write_bytes(b"")
+    assert installer._detect_mod_type(profile) == "me3"
+
+    assert installer._detect_mod_type(tmp_path / "empty") == "unknown"
+
+
+def test_detect_mod_type_reuses_parent_walk_for_subfolders(monkeypatch, tmp_path):
+    installer = _installer()
+    (tmp_path / "Coop" / "bin").mkdir(parents=True)
+    (tmp_path / "Coop" / "bin" / "coop.dll").write_bytes(b"")
+    (tmp_path / "Notes").mkdir()
+    (tmp_path / "Notes" / "readme.txt").write_text("")
+
+    assert installer._detect_mod_type(tmp_path) == "native"
+
+    def no_rescan(folder):
+        pytest.fail(f"{folder} was walked again")
+
+    monkeypatch.setattr(mod_installer, "_scan_flags", no_rescan)
+    assert installer._detect_mod_type(tmp_path / "Coop") == "native"
+    assert installer._detect_mod_type(tmp_path / "Notes") == "unknown"
+
+
+def test_find_mod_root_unwraps_single_child_folders(tmp_path):
+    installer = _installer()
+    inner = tmp_path / "Archive" / "v1.2" / "MyMod"
+    (inner / "parts").mkdir(parents=True)
+    (tmp_path / "Archive" / ".DS_Store").write_text("")
+
+    assert installer._find_mod_root(tmp_path / "Archive") == inner
+
+    (tmp_path / "Archive" / "v1.2" / "readme.txt").write_text("")
+    installer._clear_scan_caches()
+    assert installer._find_mod_root(tmp_path / "Archive") == inner.parent
+
+
+def test_install_mod_rejects_symlinked_wrapper_folder(monkeypatch, tmp_path):
+    installer = _installer()
+    warnings = []
+    monkeypatch.setattr(
+        mod_installer.QMessageBox, "warning", lambda *args: warnings.append(args)
+    )
+    user_dir = tmp_path / "Documents" / "Coop"
+    user_dir.mkdir(parents=True)
+    (user_dir / "coop.dll").write_bytes(b"")
+    source = tmp_path / "Download"
+    source.mkdir()
+    (source / "Wrapper").symlink_to(user_dir, target_is_directory=True)
+
+    assert installer._find_mod_root(source) == source
+    assert installer.install_mod(source) == []
+    assert len(warnings) == 1
+    assert (user_dir / "coop.dll").is_file()
+
+
+def test_is_in_package_rewrites_native_path(tmp_path):
+    installer = _installer()
+    pkg = tmp_path / "profile" / "ModPkg"
+    package_source_map = {pkg: "Renamed"}
+    native = {"path": "ModPkg/dll/x.dll"}
+
+    assert installer._is_in_package(
+        pkg / "dll" / "x.dll", package_source_map, native, is_config=False
+    )
+    assert native["path"] == "Renamed/dll/x.dll"
+    assert installer._is_in_package(pkg, package_source_map)
+    assert not installer._is_in_package(
+        tmp_path / "profile" / "ModPkgOther" / "x.dll", package_source_map
+    )
+
+
+def test_parse_nexus_url():
+    installer = _installer()
+    assert installer._parse_nexus_url(
+        "https://www.nexusmods.com/eldenring/mods/510?tab=files"
+    ) == ("eldenring", 510)
+    assert installer._parse_nexus_url("nexusmods.com/nightreign/mods/7") == (
+        "nightreign",
+        7,
+    )
+    assert installer._parse_nexus_url("https://example.com/mods/1") is None
+
+
+def test_is_mod_installed_matches_folders_and_dll_stems(tmp_path):
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = tmp_path
+    (tmp_path / "SeamlessCoop").mkdir()
+    (tmp_path / "ErSoundMod.dll").write_bytes(b"")
+
+    assert installer._is_mod_installed("seamlesscoop")
+    assert installer._is_mod_installed("ersoundmod")
+    assert not installer._is_mod_installed("OtherMod")
+
+
+def test_iter_candidates_lists_root_then_distinct_children(tmp_path):
+    installer = _installer()
+    root = tmp_path / "bundle"
+    root.mkdir()
+    (root / "regulation.bin").write_bytes(b"")
+    (root / "Coop").mkdir()
+    (root / "Coop" / "coop.dll").write_bytes(b"")
+    (root / "Assets" / "parts").mkdir(parents=True)
+
+    assert list(installer._iter_candidates(root)) == [
+        (root, "package"),
+        (root / "Coop", "native"),
+    ]
+
+    profile = tmp_path / "profile"
+    (profile / "Coop").mkdir(parents=True)
+    (profile / "Coop" / "coop.dll").write_bytes(b"")
+    (profile / "mod.me3").write_text("")
+    assert list(installer._iter_candidates(profile)) == [(profile, "me3")]
+
+
+def test_is_staged_only_for_scratch_folder(tmp_path):
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = tmp_path / "mods"
+
+    user_dir = tmp_path / "Documents"
+    user_dir.mkdir()
+    with installer.staging_dir() as tmp:
+        assert installer._is_staged(tmp / "extract" / "SomeMod")
+        (tmp / "link").symlink_to(user_dir, target_is_directory=True)
+        assert not installer._is_staged(tmp / "link" / "SomeMod")
+    assert not installer._is_staged(tmp_path / "mods" / "SomeMod")
+    assert not installer._is_staged(tmp_path / ".me3_temp_extraction_other" / "x")
+
+
+def test_staging_dir_follows_a_changed_mods_dir(tmp_path):
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = tmp_path / "old" / "mods"
+    assert installer._get_mods_dir() == tmp_path / "old" / "mods"
+
+    installer.config_manager.get_mods_dir.return_value = tmp_path / "new" / "mods"
+    with installer.staging_dir() as tmp:
+        assert tmp.parent == tmp_path / "new" / ".me3_temp_extraction"
+        assert installer._is_staged(tmp / "SomeMod")
+
+
+@pytest.mark.parametrize(
+    "name, valid",
+    [
+        ("Seamless Co-op", True),
+        ("CONSOLE", True),
+        ("COM10", True),
+        ("", False),
+        ("..", False),
+        ("con", False),
+        ("Lpt1.txt", False),
+        ("trailing.", False),
+        ("trailing ", False),
+        ("a:b", False),
+        ("x" * 61, False),
+    ],
+)
+def test_validate_mod_name(name, valid):
+    assert _validate_mod_name(name) is valid
+
+
+def test_safe_join_stays_inside_jail(tmp_path):
+    base = tmp_path / "profile"
+    (base / "natives").mkdir(parents=True)
+    installer = _installer()
+
+    joined = installer._safe_join(base, "natives/mod.dll")
+    assert joined == str((base / "natives" / "mod.dll").resolve())
+
+    assert installer._safe_join(base, Path("../outside.dll")) is None
+    assert installer._safe_join(base, Path(tmp_path / "abs.dll")) is None
+    assert installer._safe_join(
+        base / "natives", Path("../x.dll"), jail_dir=base
+    ) == str((base / "x.dll").resolve())
+
+
+def test_process_import_native_entry_collects_dll_and_config_dir(tmp_path):
+    base = tmp_path / "profile"
+    (base / "natives" / "mod").mkdir(parents=True)
+    (base / "natives" / "mod.dll").write_bytes(b"MZ")
+    (base / "shared.dll").write_bytes(b"MZ")
+    (base / "shared").mkdir()
+    installer = _installer()
+
+    items: list = []
+    installer._process_import_native_entry(
+        {"path": "natives\\mod.dll"}, base, {}, items, jail_dir=base
+    )
+    installer._process_import_native_entry(
+        {"path": "natives/../shared.dll"}, base, {}, items, jail_dir=base
+    )
+
+    real = base.resolve()
+    assert items == [
+        (real / "natives" / "mod.dll", "natives/mod.dll"),
+        (real / "natives" / "mod", "natives/mod"),
+        (real / "shared.dll", "shared.dll"),
+        (real / "shared", "shared"),
+    ]
+
+
+def test_install_worker_copies_and_preserves_configs(qtbot, tmp_path):
+    mods_dir = tmp_path / "mods"
+    existing = mods_dir / "MyMod"
+    existing.mkdir(parents=True)
+    (existing / "mod.dll").write_bytes(b"old")
+    (existing / "settings.ini").write_text("volume=3\n")
+
+    source = tmp_path / "src" / "MyMod"
+    (source / "parts").mkdir(parents=True)
+    (source / "mod.dll").write_bytes(b"new")
+    (source / "settings.ini").write_text("; defaults\nvolume=10\n")
+    (source / "parts" / "data.bin").write_bytes(b"\x01" * 64)
+
+    worker = InstallWorker([source], mods_dir)
+    worker.run()
+
+    assert worker.errors == []
+    assert worker.installed_count == 1
+    assert (existing / "mod.dll").read_bytes() == b"new"
+    assert (existing / "parts" / "data.bin").read_bytes() == b"\x01" * 64
+    assert (existing / "settings.ini").read_text() == "; defaults\nvolume=3\n"
+
+
+def test_install_worker_moves_consumed_sources_into_new_dest(qtbot, tmp_path):
+    mods_dir = tmp_path / "mods"
+    mods_dir.mkdir()
+    staged = tmp_path / "staging" / "NewMod"
+    (staged / "parts").mkdir(parents=True)
+    (staged / "parts" / "data.bin").write_bytes(b"\x02" * 8)
+
+    worker = InstallWorker([staged], mods_dir, consume_sources=True)
+    worker.run()
+
+    assert worker.errors == []
+    assert worker.installed_count == 1
+    assert not staged.exists()
+    assert (mods_dir / "NewMod" / "parts" / "data.bin").read_bytes() == b"\x02" * 8
+    assert [p.name for p in mods_dir.iterdir()] == ["NewMod"]
+
+
+def test_install_worker_merges_into_binary_only_mod(qtbot, tmp_path):
+    mods_dir = tmp_path / "mods"
+    existing = mods_dir / "DllMod"
+    existing.mkdir(parents=True)
+    (existing / "mod.dll").write_bytes(b"old")
+    (existing / "extra.dll").write_bytes(b"keep")
+    staged = tmp_path / "staging" / "DllMod"
+    staged.mkdir(parents=True)
+    (staged / "mod.dll").write_bytes(b"new")
+
+    worker = InstallWorker([staged], mods_dir, consume_sources=True)
+    worker.run()
+
+    assert worker.errors == []
+    assert (existing / "mod.dll").read_bytes() == b"new"
+    assert (existing / "extra.dll").read_bytes() == b"keep"
+    assert [p.name for p in mods_dir.iterdir()] == ["DllMod"]
+
+
+def test_install_worker_rejects_destinations_outside_mods_dir(qtbot, tmp_path):
+    mods_dir = tmp_path / "mods"
+    mods_dir.mkdir()
+    (tmp_path / "mods_other").mkdir()
+    source = tmp_path / "src" / "Mod"
+    source.mkdir(parents=True)
+    (source / "mod.dll").write_bytes(b"")
+
+    worker = InstallWorker(
+        [(source, Path("../escape")), (source, Path("../mods_other/Mod"))], mods_dir
+    )
+    worker.run()
+
+    assert worker.installed_count == 0
+    assert len(worker.errors) == 2
+    assert not (tmp_path / "escape").exists()
+    assert not (tmp_path / "mods_other" / "Mod").exists()
+
+
+def test_install_worker_rejects_sources_with_symlinks(qtbot, tmp_path):
+    mods_dir = tmp_path / "mods"
+    mods_dir.mkdir()
+    linked = tmp_path / "src" / "Linked"
+    (linked / "deep").mkdir(parents=True)
+    (linked / "deep" / "link").symlink_to(tmp_path)
+    link_file = tmp_path / "src" / "mod.dll"
+    link_file.symlink_to(tmp_path / "src" / "missing.dll")
+
+    worker = InstallWorker([linked, link_file], mods_dir)
+    worker.run()
+
+    assert worker.installed_count == 0
+    assert len(worker.errors) == 2
+    assert list(mods_dir.iterdir()) == []
+
+
+def test_report_progress_survives_bad_translation(qtbot, monkeypatch, tmp_path):
+    lang = translator.current_language
+    monkeypatch.setitem(
+        translator.translations, lang, {"installing_status": "Installing {nom}"}
+    )
+    worker = InstallWorker([], tmp_path / "mods")
+    emitted = []
+    worker.progress_update.connect(lambda *args: emitted.append(args))
+
+    worker._report_progress("SomeMod", 1, 2)
+
+    assert emitted == [("Installing {nom}", 1, 2)]
+
+
+def test_copy_with_progress_uses_plan_without_rescanning(qtbot, tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "sub" / "a.txt").write_text("a")
+    (src / "__MACOSX").mkdir()
+    (src / "__MACOSX" / "junk").write_text("")
+    plan_dirs, plan_files, has_junk, has_symlink = _plan_copy(src)
+    assert plan_dirs == ["sub"]
+    assert plan_files == [os.path.join("sub", "a.txt")]
+    assert has_junk and not has_symlink
+
+    # Files added after planning are not picked up: src isn't walked again
+    (src / "late.txt").write_text("late")
+    worker = InstallWorker([], tmp_path / "mods")
+    worker._copy_recursive_with_progress(
+        src, tmp_path / "dst", 0, 1, shutil.copy2, (plan_dirs, plan_files)
+    )
+    assert (tmp_path / "dst" / "sub" / "a.txt").read_text() == "a"
+    assert not (tmp_path / "dst" / "late.txt").exists()
+    assert not (tmp_path / "dst" / "__MACOSX").exists()
+
+
+def test_copy_with_progress_reports_every_failed_file(qtbot, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (src / name).write_text(name)
+
+    def flaky_copy(s, d, **kwargs):
+        if Path(s).name != "b.txt":
+            raise PermissionError("denied")
+        return shutil.copy2(s, d, **kwargs)
+
+    worker = InstallWorker([], tmp_path / "mods")
+    with pytest.raises(shutil.Error) as exc_info:
+        worker._copy_recursive_with_progress(src, tmp_path / "dst", 0, 3, flaky_copy)
+
+    failed = sorted(Path(s).name for s, _d, _why in exc_info.value.args[0])
+    assert failed == ["a.txt", "c.txt"]
+    assert (tmp_path / "dst" / "b.txt").read_text() == "b.txt"
+
+
+def test_copy_with_progress_settles_copies_before_raising(qtbot, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(20):
+        (src / f"{i:02}.txt").write_text("x")
+    running = set()
+    lock = threading.Lock()
+
+    def slow_copy(s, d, **kwargs):
+        with lock:
+            running.add(s)
+        try:
+            if Path(s).name == "00.txt":
+                raise ValueError("bad copy")
+            time.sleep(0.02)
+            shutil.copy2(s, d, **kwargs)
+        finally:
+            with lock:
+                running.discard(s)
+
+    worker = InstallWorker([], tmp_path / "mods")
+    with pytest.raises(ValueError):
+        worker._copy_recursive_with_progress(src, tmp_path / "dst", 0, 20, slow_copy)
+
+    assert running == set()
+    copied = len(list((tmp_path / "dst").iterdir()))
+    time.sleep(0.1)
+    assert len(list((tmp_path / "dst").iterdir())) == copied
+
+
+def test_copy_with_progress_stops_submitting_once_interrupted(qtbot, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.txt").write_text("x")
+    worker = InstallWorker([], tmp_path / "mods")
+    worker._pool = SimpleNamespace(submit=MagicMock())
+    worker.isInterruptionRequested = lambda: True
+
+    worker._copy_recursive_with_progress(src, tmp_path / "dst", 0, 1)
+
+    worker._pool.submit.assert_not_called()
+
+
+def test_load_hook_module_reuses_unchanged_script(tmp_path):
+    script = tmp_path / "hooks.py"
+    script.write_text("LOADS = []\nLOADS.append(1)\n")
+
+    cache = {}
+
+    first = _load_hook_module(script, cache)
+    assert _load_hook_module(script, cache) is first
+    assert first.LOADS == [1]
+    # The next install starts with a fresh cache, so module state is reset
+    assert _load_hook_module(script, {}) is not first
+
+    mtime_ns = script.stat().st_mtime_ns
+    script.write_text("LOADS = [22]\n")
+    # Same mtime (coarse timestamps), different size
+    os.utime(script, ns=(0, mtime_ns))
+    assert _load_hook_module(script, cache).LOADS == [22]
+
+
+def test_copy_with_progress_classifies_conflicts(monkeypatch, tmp_path):
+    mods_dir = tmp_path / "mods"
+    (mods_dir / "FolderMod").mkdir(parents=True)
+    (mods_dir / "FolderMod" / "settings.ini").write_text("[a]")
+    (mods_dir / "native.dll").write_bytes(b"MZ")
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = mods_dir
+
+    asked = []
+
+    def decline(_parent, _title, text, _buttons):
+        asked.append(text)
+        return mod_installer.QMessageBox.StandardButton.No
+
+    monkeypatch.setattr(mod_installer.QMessageBox, "question", decline)
+    src = tmp_path / "src"
+    items = [
+        (src, Path("FolderMod")),
+        (src, Path("FolderMod/settings.ini")),
+        (src, Path("native.dll")),
+    ]
+
+    assert installer._copy_with_progress(items) is False
+    # Folders and binaries are listed first, shipped configs after them
+    binary_part, _, _ = asked[0].partition("settings.ini")
+    assert "- FolderMod" in binary_part
+    assert "- native.dll" in binary_part
+    assert "- FolderMod/settings.ini" not in asked[0]
+
+
+def test_sanitize_mod_name_replaces_forbidden_chars():
+    installer = _installer()
+    assert installer._sanitize_mod_name(' .My<Mod>: "v2"/a\\b|c?*. ') == (
+        "My_Mod__ _v2__a_b_c__"
+    )
+    assert len(installer._sanitize_mod_name("x" * 100)) == 60
+
+
+def test_nexus_dependencies_already_installed_are_skipped(monkeypatch, tmp_path):
+    (tmp_path / "SharedLib").mkdir()
+    (tmp_path / "helper.dll").write_bytes(b"MZ")
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = tmp_path
+    monkeypatch.setattr(
+        mod_installer.QMessageBox,
+        "warning",
+        lambda *a, **k: pytest.fail("should not prompt"),
+    )
+    url = "https://www.nexusmods.com/eldenring/mods/1"
+    profile = {
+        "natives": [{"path": "helper.dll", "nexus_link": url}],
+        "packages": [{"path": "x", "install_name": "sharedlib", "nexus_link": url}],
+    }
+
+    assert installer._handle_nexus_dependencies(profile) == (True, [])
+
+
+def test_dep_install_name_uses_dll_name_for_natives():
+    def native(path):
+        return {"type": "native", "entry": {"path": path}}
+
+    assert ModInstaller._dep_install_name(native("dlls/foo.dll")) == "foo.dll"
+    assert ModInstaller._dep_install_name(native("Coop\\ersc.DLL")) == "ersc.DLL"
+    assert ModInstaller._dep_install_name(native("dlls/")) is None
+    assert ModInstaller._dep_install_name(native("")) is None
+    package = {"type": "package", "entry": {"path": "assets/parts"}}
+    assert ModInstaller._dep_install_name(package) is None
+
+
+def test_nexus_dependency_is_not_matched_by_its_parent_folder(monkeypatch, tmp_path):
+    (tmp_path / "dlls").mkdir()
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = tmp_path
+    installer.game_page.nexus_service = None
+    prompts = []
+    monkeypatch.setattr(
+        mod_installer.QMessageBox, "warning", lambda *a, **k: prompts.append(a)
+    )
+    url = "https://www.nexusmods.com/eldenring/mods/1"
+    profile = {"natives": [{"path": "dlls/foo.dll", "nexus_link": url}]}
+
+    # Still missing, so the user is asked to log in to fetch it
+    assert installer._handle_nexus_dependencies(profile) == (False, [])
+    assert len(prompts) == 1
+
+
+def test_nexus_dependency_info_is_fetched_concurrently(monkeypatch, tmp_path):
+    installer = _installer()
+    installer.config_manager.get_mods_dir.return_value = tmp_path
+    # Both lookups must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_mod(_domain, mod_id):
+        barrier.wait()
+        return SimpleNamespace(name=f"Mod {mod_id}")
+
+    installer.game_page.nexus_service.get_mod.side_effect = get_mod
+    asked = []
+
+    def decline(_parent, _title, text, _buttons):
+        asked.append(text)
+        return mod_installer.QMessageBox.StandardButton.No
+
+    monkeypatch.setattr(mod_installer.QMessageBox, "question", decline)
+    url = "https://www.nexusmods.com/eldenring/mods/"
+    profile = {"packages": [{"nexus_link": url + "1"}, {"nexus_link": url + "2"}]}
+
+    assert installer._handle_nexus_dependencies(profile) == (False, [])
+    assert "1. Mod 1" in asked[0]
+    assert "2. Mod 2" in asked[0]
@@ -0,0 +1,187 @@
+from types import SimpleNamespace
+
+from me3_manager.core.mod_manager import ModStatus, ModType
+from me3_manager.ui.game_page_components.mod_list_handler import ModListHandler
+
+
+def _mod(name, enabled):
+    return SimpleNamespace(
+        name=name,
+        status=ModStatus.ENABLED if enabled else ModStatus.DISABLED,
+        is_external=False,
+        mod_type=ModType.FOLDER,
+        advanced_options={},
+        parent_package=None,
+        is_container=False,
+    )
+
+
+def _game_page(tmp_path, mods):
+    search_bar = SimpleNamespace(text=lambda: "")
+    return SimpleNamespace(
+        game_name="eldenring",
+        config_manager=SimpleNamespace(get_mods_dir=lambda game: tmp_path),
+        mod_manager=SimpleNamespace(
+            get_all_mods=lambda game: dict(mods),
+            has_advanced_options=lambda mod_info: bool(mod_info.advanced_options),
+        ),
+        nexus_metadata=SimpleNamespace(
+            find_for_local_mods=lambda paths: {}, file_signature=lambda: None
+        ),
+        search_bar=search_bar,
+        search_mode="local",
+        current_filter="all",
+        current_page=1,
+        mods_per_page=10,
+        expanded_states={},
+        update_pagination=lambda: None,
+        update_pagination_status=lambda: None,
+        update_profile_dropdown=lambda: None,
+    )
+
+
+def test_apply_filters_uses_buckets_and_search(tmp_path):
+    mods = {
+        "a": _mod("Alpha Mod", True),
+        "b": _mod("Beta", False),
+        "c": _mod("alphabet", False),
+    }
+    gp = _game_page(tmp_path, mods)
+    handler = ModListHandler(gp)
+    handler.load_mods()
+    assert list(gp.filtered_mods) == ["a", "b", "c"]
+
+    gp.current_filter = "disabled"
+    handler.apply_filters()
+    assert list(gp.filtered_mods) == ["b", "c"]
+
+    gp.search_bar.text = lambda: "ALPHA"
+    handler.apply_filters()
+    assert list(gp.filtered_mods) == ["c"]
+
+    gp.current_filter = "enabled"
+    handler.apply_filters()
+    assert list(gp.filtered_mods) == ["a"]
+
+    # Mods passed in directly aren't bucketed and go through the predicates
+    handler.apply_filters(source_mods={})
+    assert gp.filtered_mods == {}
+
+
+def test_grouping_is_reused_until_filters_change(tmp_path):
+    mods = {"a": _mod("Alpha", True), "b": _mod("Beta", False)}
+    gp = _game_page(tmp_path, mods)
+    handler = ModListHandler(gp)
+    handler.load_mods()
+
+    grouped = handler.grouped_filtered_mods()
+    assert list(grouped) == ["a", "b"]
+    assert handler.grouped_filtered_mods() is grouped
+
+    gp.current_filter = "enabled"
+    handler.apply_filters()
+    assert list(handler.grouped_filtered_mods()) == ["a"]
+
+
+def test_apply_filters_skips_redraw_when_matches_are_unchanged(tmp_path):
+    mods = {"a": _mod("Alpha", True), "b": _mod("Beta", False)}
+    gp = _game_page(tmp_path, mods)
+    redraws = []
+    gp.update_pagination = lambda: redraws.append(list(gp.filtered_mods))
+    handler = ModListHandler(gp)
+    handler.load_mods()
+    assert redraws == [["a", "b"]]
+
+    gp.search_bar.text = lambda: "a"
+    handler.apply_filters()
+    gp.search_bar.text = lambda: "al"
+    handler.apply_filters()
+    assert redraws == [["a", "b"], ["a"]]
+
+    # Reloading unchanged mods keeps the existing entries and widgets, but
+    # still refreshes the status summary
+    status_refreshes = []
+    gp.update_pagination_status = lambda: status_refreshes.append(True)
+    entries = gp.all_mods_data
+    handler.load_mods()
+    assert gp.all_mods_data is entries
+    assert len(redraws) == 2
+    assert status_refreshes == [True]
+
+    # A changed mod brings new entries, so the list is redrawn
+    mods["b"] = _mod("Beta", True)
+    handler.load_mods()
+    assert gp.all_mods_data is not entries
+    assert redraws[-1] == ["a"] and len(redraws) == 3
+
+
+def test_grouping_renames_only_children_shown_in_a_tree(tmp_path):
+    pkg = _mod("Pkg", True)
+    child = _mod("Pkg/inner", True)
+    child.mod_type = ModType.DLL
+    child.parent_package = "Pkg"
+    orphan = _mod("Gone/extra", True)
+    orphan.mod_type = ModType.DLL
+    orphan.parent_package = "Gone"
+    mods = {"/m/Pkg": pkg, "/m/Pkg/inner.dll": child, "/m/Gone/extra.dll": orphan}
+    gp = _game_page(tmp_path, mods)
+    handler = ModListHandler(gp)
+    handler.load_mods()
+
+    grouped = handler.grouped_filtered_mods()
+    tree = grouped["/m/Pkg"]
+    assert tree["type"] == "parent_with_children"
+    assert tree["children"]["/m/Pkg/inner.dll"].name == "inner"
+    assert gp.all_mods_data["/m/Pkg/inner.dll"].name == "Pkg/inner"
+    assert grouped["/m/Gone/extra.dll"]["info"].name == "Gone/extra"
+
+
+def test_mod_widget_actions_route_through_one_dispatcher(qtbot, tmp_path):
+    child = _mod("Pkg/inner", True)
+    child.mod_type = ModType.DLL
+    child.parent_package = "Pkg"
+    mods = {"/m/Pkg/inner.dll": child}
+    gp = _game_page(tmp_path, mods)
+    calls = []
+    gp.toggle_mod = lambda path, enabled: calls.append(("toggle", path, enabled))
+    gp.delete_mod = lambda path: calls.append(("delete", path))
+    handler = ModListHandler(gp)
+    handler.load_mods()
+    info = gp.all_mods_data["/m/Pkg/inner.dll"]
+
+    widget = handler._create_mod_widget("/m/Pkg/inner.dll", info)
+    qtbot.addWidget(widget)
+    widget.on_toggle()
+    widget._request("delete")
+    assert calls == [
+        ("toggle", "/m/Pkg/inner.dll", False),
+        ("delete", "/m/Pkg/inner.dll"),
+    ]
+
+    # Nested DLL rows can be toggled but not deleted
+    calls.clear()
+    nested = handler._create_mod_widget("/m/Pkg/inner.dll", info, is_nested=True)
+    qtbot.addWidget(nested)
+    nested._request("delete")
+    nested.on_toggle()
+    assert calls == [("toggle", "/m/Pkg/inner.dll", False)]
+
+
+def test_released_rows_are_reused_until_their_entry_changes(qtbot, tmp_path):
+    mods = {"a": _mod("Alpha", True)}
+    gp = _game_page(tmp_path, mods)
+    handler = ModListHandler(gp)
+    handler.load_mods()
+
+    widget = handler._create_mod_widget("a", gp.all_mods_data["a"])
+    qtbot.addWidget(widget)
+    handler.release_mod_widget(widget)
+    assert handler._create_mod_widget("a", gp.all_mods_data["a"]) is widget
+
+    handler.release_mod_widget(widget)
+    mods["a"] = _mod("Alpha", False)
+    handler.load_mods()
+    fresh = handler._create_mod_widget("a", gp.all_mods_data["a"])
+    qtbot.addWidget(fresh)
+    assert fresh is not widget
+    assert not fresh.is_enabled
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+from me3_manager.core.mod_manager import ImprovedModManager
+
+
+def test_enable_natives_with_options_writes_profile_once():
+    manager = ImprovedModManager.__new__(ImprovedModManager)
+    manager.config_manager = MagicMock()
+    config = {"natives": [{"path": "old.dll", "enabled": False}]}
+    manager.config_manager._parse_toml_config.return_value = config
+    manager._get_config_key_for_mod = lambda mod_path, _game: mod_path
+    manager._write_improved_config = MagicMock()
+
+    success, _ = manager.enable_natives_with_options(
+        "eldenring", [("old.dll", {"load_early": True}), ("new.dll", None)]
+    )
+
+    assert success
+    manager._write_improved_config.assert_called_once()
+    assert config["natives"] == [
+        {"path": "old.dll", "load_early": True},
+        {"path": "new.dll"},
+    ]
+
+
+def test_set_mods_enabled_writes_profile_once(tmp_path):
+    manager = ImprovedModManager.__new__(ImprovedModManager)
+    manager.config_manager = MagicMock()
+    config = {"natives": []}
+    manager.config_manager._parse_toml_config.return_value = config
+    manager._get_config_key_for_mod = lambda mod_path, _game: mod_path
+    manager._write_improved_config = MagicMock()
+    container = tmp_path / "Coop"
+    container.mkdir()
+    (container / "coop.dll").write_bytes(b"MZ")
+    manager._analyze_folder_content = lambda _path: False
+
+    success, _ = manager.set_mods_enabled(
+        "eldenring", [str(container), str(tmp_path / "other.dll")], True
+    )
+
+    assert success
+    manager._write_improved_config.assert_called_once()
+    assert config["natives"] == [
+        {"path": str(container / "coop.dll")},
+        {"path": str(tmp_path / "other.dll")},
+    ]
@@ -0,0 +1,40 @@
+from me3_manager.core.nexus_metadata import NexusMetadataManager, TrackedNexusMod
+
+
+def test_find_for_local_mods_matches_exact_and_container_paths(tmp_path):
+    manager = NexusMetadataManager(tmp_path, "Elden Ring")
+    mods = tmp_path / "mods"
+    items = {
+        str(mods / "Exact"): TrackedNexusMod(
+            local_mod_path=str(mods / "Exact"), game_domain="eldenring", mod_id=1
+        ),
+        str(mods / "Container" / "inner.dll"): TrackedNexusMod(
+            local_mod_path=str(mods / "Container" / "inner.dll"),
+            game_domain="eldenring",
+            mod_id=2,
+        ),
+    }
+    manager.save_game("eldenring", items)
+
+    found = manager.find_for_local_mods(
+        [str(mods / "Exact"), str(mods / "Container"), str(mods / "Untracked")]
+    )
+    assert {path: item.mod_id for path, item in found.items()} == {
+        str(mods / "Exact"): 1,
+        str(mods / "Container"): 2,
+    }
+    assert manager.find_for_local_mod(str(mods / "Container")).mod_id == 2
+    assert manager.find_for_local_mod(str(mods / "Untracked")) is None
+
+
+def test_file_signature_changes_when_metadata_is_saved(tmp_path):
+    manager = NexusMetadataManager(tmp_path, "Elden Ring")
+    assert manager.file_signature() is None
+
+    manager.save_game("eldenring", {})
+    first = manager.file_signature()
+    assert first is not None
+
+    tracked = TrackedNexusMod(local_mod_path="x", game_domain="eldenring", mod_id=3)
+    manager.save_game("eldenring", {"x": tracked})
+    assert manager.file_signature() != first